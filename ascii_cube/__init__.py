@@ -0,0 +1,57 @@
+"""3D ASCII spinning cube renderer
+
+The render pipeline (geometry, raster, scene, cache and timing) needs only
+NumPy and is imported eagerly. Recording, profiling and the backends are
+imported on first use, so importing this package never loads tkinter or
+curses:
+
+    from ascii_cube import CubeSnapshot, render_snapshot
+"""
+import importlib
+
+from .cache import FrameCache
+from .geometry import (
+    CUBE_EDGES,
+    CUBE_MESH,
+    CUBE_VERTICES,
+    Mesh,
+    clip_near_plane,
+    frame_matrix,
+    make_mesh,
+    perspective_divide,
+    rotation_matrix,
+)
+from .raster import BLANK, FrameBuffer, cells_to_rows, visible_steps
+from .scene import CubeSnapshot, LiveFrames, SpinningCube, render_snapshot
+from .timing import AnimationClock, FrameScheduler, FrameStats, Invalidation
+
+# Name -> module it lives in, for everything imported on first use
+_LAZY = {
+    'LoopFile': '.record',
+    'loop_period': '.record',
+    'record_animation': '.record',
+    'render_cells': '.record',
+    'render_in_pool': '.record',
+    'write_loop_file': '.record',
+    'load_obj': '.mesh',
+    'SamplingProfiler': '.profiler',
+    'TraceRecorder': '.profiler',
+    'drive': '.backends',
+    'AnsiTerminal': '.backends',
+    'CursesTerminal': '.backends',
+    'NullBackend': '.backends',
+    'RecorderBackend': '.backends',
+    'ModernTerminalWindow': '.backends',
+    'TextDiffPresenter': '.backends',
+}
+
+def __getattr__(name):
+    """Import a module the first time one of its names is used"""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,69 @@
+"""Output backends and the loop that drives them
+
+A backend has size() -> (width, height), present(cells, snapshot, stats),
+close() and a closed flag. The backends are imported on first use, so
+importing this package loads neither tkinter nor curses:
+
+    from ascii_cube.backends import drive, NullBackend
+"""
+import importlib
+import time
+
+from ..timing import AnimationClock, FrameStats
+
+# Backend class -> module it lives in, relative to this package
+_LAZY = {
+    'AnsiTerminal': '.ansi',
+    'CursesTerminal': '.curses_backend',
+    'NullBackend': '.null',
+    'RecorderBackend': '.recorder',
+    'AsciicastWriter': '.recorder',
+    'TextFrameWriter': '.recorder',
+    'ModernTerminalWindow': '.tk',
+    'TextDiffPresenter': '.tk',
+}
+
+def __getattr__(name):
+    """Import a backend module the first time one of its names is used"""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+def drive(backend, frames, wait=None, stats=None, clock=None, timestep=None, max_frames=None):
+    """Render frames from a LiveFrames or LoopFile into a backend until it closes
+    
+    A backend has size() -> (width, height), present(cells, snapshot, stats),
+    close() and a closed flag. wait paces the loop; without it frames are
+    rendered flat out. Animation time comes from clock, or is frame number
+    times timestep for offline output. Returns the number of frames presented.
+    """
+    stats = stats if stats is not None else FrameStats()
+    clock = clock if clock is not None else AnimationClock()
+    fitted = None
+    number = 0
+    while not backend.closed and (max_frames is None or number < max_frames):
+        if wait is not None:
+            wait()
+        
+        width, height = backend.size()
+        if backend.closed:
+            break
+        if width <= 0 or height <= 0:
+            # Not laid out yet
+            time.sleep(0.1)
+            continue
+        if (width, height) != fitted:
+            frames.fit(width, height)
+            fitted = (width, height)
+        
+        elapsed = number * timestep if timestep is not None else clock.elapsed()
+        with stats.measure('frame'):
+            cells, snapshot = frames.frame(elapsed, width, height, stats)
+        backend.present(cells, snapshot, stats)
+        number += 1
+    return number
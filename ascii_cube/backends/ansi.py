@@ -0,0 +1,119 @@
+"""Headless terminal backend using ANSI escapes"""
+import shutil
+import signal
+import sys
+
+import numpy as np
+
+from ..raster import cells_to_rows
+from ..timing import FrameScheduler, _no_measure
+from . import drive
+
+class AnsiTerminal:
+    """Headless front end that draws frames to a terminal with ANSI escapes
+    
+    Only the cells that changed since the previous frame are written, each
+    run addressed with a cursor-position escape, and every frame is wrapped
+    in synchronized-output markers so the terminal never shows half a frame.
+    """
+    
+    SYNC_BEGIN = '\x1b[?2026h'
+    SYNC_END = '\x1b[?2026l'
+    
+    # Unchanged cells between two changed runs are rewritten rather than
+    # paying for another cursor-position escape when the gap is this short
+    MERGE_GAP = 8
+    
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdout
+        self.width = 0
+        self.height = 0
+        self.previous = None
+        self.resized = True
+        self.bytes_written = 0
+        self.frames_written = 0
+        self.closed = False
+    
+    def on_resize(self, signum, frame):
+        """SIGWINCH handler; the new size is picked up before the next frame"""
+        self.resized = True
+    
+    def update_dimensions(self):
+        """Re-read the terminal size and force a full redraw"""
+        size = shutil.get_terminal_size()
+        self.width, self.height = size.columns, size.lines
+        self.previous = None
+        self.resized = False
+    
+    def encode(self, cells):
+        """Return the escape sequences that turn the previous frame into this one"""
+        height, width = cells.shape
+        rows = cells_to_rows(cells)
+        out = [self.SYNC_BEGIN]
+        
+        if self.previous is None or self.previous.shape != cells.shape:
+            # Nothing usable on screen: clear and draw every row
+            out.append('\x1b[2J')
+            out.extend(f'\x1b[{y + 1};1H{row}' for y, row in enumerate(rows))
+        else:
+            changed = cells != self.previous
+            for y in np.flatnonzero(changed.any(axis=1)).tolist():
+                columns = np.flatnonzero(changed[y])
+                # Split the changed columns into runs, merging short gaps
+                breaks = np.flatnonzero(np.diff(columns) > self.MERGE_GAP)
+                run_starts = columns[np.concatenate(([0], breaks + 1))].tolist()
+                run_ends = columns[np.concatenate((breaks, [len(columns) - 1]))].tolist()
+                row = rows[y]
+                for start, end in zip(run_starts, run_ends):
+                    out.append(f'\x1b[{y + 1};{start + 1}H{row[start:end + 1]}')
+        
+        out.append(self.SYNC_END)
+        return ''.join(out)
+    
+    def size(self):
+        """Terminal size, re-read after a resize"""
+        # Without SIGWINCH, fall back to checking the size every frame
+        if not hasattr(signal, 'SIGWINCH') and tuple(shutil.get_terminal_size()) != (self.width, self.height):
+            self.resized = True
+        if self.resized:
+            self.update_dimensions()
+        return self.width, self.height
+    
+    def present(self, cells, snapshot=None, stats=None):
+        """Write one frame and remember it as the new on-screen state"""
+        measure = stats.measure if stats is not None else _no_measure
+        with measure('present'):
+            data = self.encode(cells)
+            self.stream.write(data)
+            self.stream.flush()
+        self.previous = cells.copy()
+        self.bytes_written += len(data.encode('utf-8'))
+        self.frames_written += 1
+        if stats is not None:
+            stats.mark_presented()
+    
+    def open(self):
+        """Switch to the alternate screen, hide the cursor and watch for resizes"""
+        if hasattr(signal, 'SIGWINCH'):
+            signal.signal(signal.SIGWINCH, self.on_resize)
+        self.stream.write('\x1b[?1049h\x1b[?25l')
+        self.stream.flush()
+        self.update_dimensions()
+    
+    def close(self):
+        """Restore the cursor and the normal screen"""
+        self.closed = True
+        if hasattr(signal, 'SIGWINCH'):
+            signal.signal(signal.SIGWINCH, signal.SIG_DFL)
+        self.stream.write('\x1b[0m\x1b[?25h\x1b[?1049l')
+        self.stream.flush()
+    
+    def run(self, frames, target_fps=24, stats=None):
+        """Animate frames from a LiveFrames or LoopFile in the terminal until interrupted"""
+        self.open()
+        try:
+            drive(self, frames, FrameScheduler(target_fps).wait, stats)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
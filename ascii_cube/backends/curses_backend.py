@@ -0,0 +1,72 @@
+"""Terminal backend drawing through curses"""
+try:
+    import curses
+except ImportError:  # Windows without the windows-curses package
+    curses = None
+
+from ..raster import cells_to_rows
+from ..timing import FrameScheduler, _no_measure
+from . import drive
+
+class CursesTerminal:
+    """Front end that draws frames on a curses screen
+    
+    Rows go into the curses virtual screen with noutrefresh, and doupdate
+    sends only the differences to the terminal. Press q or Esc to quit.
+    """
+    
+    def __init__(self):
+        self.screen = None
+        self.width = 0
+        self.height = 0
+        self.rows = []
+        self.closed = False
+    
+    def size(self):
+        """Screen size; also polls the keyboard, closing on q or Esc"""
+        if self.screen.getch() in (ord('q'), 27):
+            self.close()
+        height, width = self.screen.getmaxyx()
+        if (width, height) != (self.width, self.height):
+            self.width, self.height = width, height
+            self.rows = []
+            self.screen.erase()
+        return self.width, self.height
+    
+    def present(self, cells, snapshot=None, stats=None):
+        """Copy the changed rows into the virtual screen and push it out"""
+        measure = stats.measure if stats is not None else _no_measure
+        with measure('stringify'):
+            rows = cells_to_rows(cells)
+        with measure('present'):
+            for y, row in enumerate(rows):
+                if y < len(self.rows) and row == self.rows[y]:
+                    continue
+                try:
+                    self.screen.addstr(y, 0, row)
+                except curses.error:
+                    # Writing the bottom-right cell moves the cursor off screen,
+                    # which curses reports even though the text was drawn
+                    pass
+            self.rows = rows
+            self.screen.noutrefresh()
+            curses.doupdate()
+        if stats is not None:
+            stats.mark_presented()
+    
+    def close(self):
+        """Stop the animation; curses.wrapper restores the terminal"""
+        self.closed = True
+    
+    def run(self, frames, target_fps=24, stats=None):
+        """Animate frames from a LiveFrames or LoopFile on a curses screen until q is pressed"""
+        if curses is None:
+            raise RuntimeError("curses is not available on this system")
+        curses.wrapper(self.animate, frames, target_fps, stats)
+    
+    def animate(self, screen, frames, target_fps, stats):
+        """Animation loop, run inside curses.wrapper"""
+        self.screen = screen
+        curses.curs_set(0)
+        screen.nodelay(True)
+        drive(self, frames, FrameScheduler(target_fps).wait, stats)
@@ -0,0 +1,24 @@
+"""Backend that discards frames, for measuring render throughput"""
+
+class NullBackend:
+    """Backend that discards every frame, to measure rendering without presentation"""
+    
+    def __init__(self, width=80, height=24):
+        self.width = width
+        self.height = height
+        self.frames_presented = 0
+        self.closed = False
+    
+    def size(self):
+        """The fixed canvas size"""
+        return self.width, self.height
+    
+    def present(self, cells, snapshot=None, stats=None):
+        """Count the frame and drop it"""
+        self.frames_presented += 1
+        if stats is not None:
+            stats.mark_presented()
+    
+    def close(self):
+        """Stop accepting frames"""
+        self.closed = True
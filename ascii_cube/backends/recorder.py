@@ -0,0 +1,81 @@
+"""Backend writing asciicast v2 or plain text recordings"""
+import json
+import time
+
+from ..raster import cells_to_rows
+from ..timing import _no_measure
+from .ansi import AnsiTerminal
+
+class AsciicastWriter:
+    """Streams frames to an asciicast v2 recording
+    
+    Each frame becomes one output event holding only the escapes needed to
+    turn the previous frame into it, as AnsiTerminal would write them.
+    """
+    
+    def __init__(self, stream, width, height, fps):
+        self.stream = stream
+        self.fps = fps
+        self.encoder = AnsiTerminal(stream=None)
+        header = {
+            'version': 2,
+            'width': width,
+            'height': height,
+            'timestamp': int(time.time()),
+            'title': "3D ASCII Spinning Cube",
+            'env': {'TERM': 'xterm-256color'}
+        }
+        self.stream.write(json.dumps(header) + '\n')
+    
+    def write(self, number, cells):
+        """Append frame number as an output event at its presentation time"""
+        data = self.encoder.encode(cells)
+        if self.encoder.previous is None:
+            data = '\x1b[?25l' + data
+        self.encoder.previous = cells.copy()
+        event = [round(number / self.fps, 6), 'o', data]
+        self.stream.write(json.dumps(event, ensure_ascii=False) + '\n')
+
+class TextFrameWriter:
+    """Streams frames as plain text, separated by form feed lines"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def write(self, number, cells):
+        """Append one frame"""
+        if number > 0:
+            self.stream.write('\f\n')
+        self.stream.write('\n'.join(cells_to_rows(cells)) + '\n')
+
+class RecorderBackend:
+    """Backend that writes frames to an asciicast v2 (.cast) or plain text recording"""
+    
+    def __init__(self, path, width, height, fps=24):
+        self.width = width
+        self.height = height
+        self.stream = open(path, 'w', encoding='utf-8')
+        if path.endswith('.cast'):
+            self.writer = AsciicastWriter(self.stream, width, height, fps)
+        else:
+            self.writer = TextFrameWriter(self.stream)
+        self.number = 0
+        self.closed = False
+    
+    def size(self):
+        """The fixed size of the recording"""
+        return self.width, self.height
+    
+    def present(self, cells, snapshot=None, stats=None):
+        """Append the next frame"""
+        measure = stats.measure if stats is not None else _no_measure
+        with measure('present'):
+            self.writer.write(self.number, cells)
+        self.number += 1
+        if stats is not None:
+            stats.mark_presented()
+    
+    def close(self):
+        """Finish the recording"""
+        self.closed = True
+        self.stream.close()
@@ -0,0 +1,577 @@
+"""Tk window backend"""
+import threading
+import time
+from collections import namedtuple
+
+from ..geometry import CUBE_MESH
+from ..raster import cells_to_rows
+from ..scene import LiveFrames, SpinningCube
+from ..timing import AnimationClock, FrameScheduler, FrameStats, Invalidation
+from . import drive
+
+# tkinter is imported only when a window is created, so the headless front
+# ends start faster and work on systems without Tk
+tk = None
+font = None
+
+def import_tkinter():
+    """Load tkinter and tkinter.font on first use"""
+    global tk, font
+    if tk is None:
+        import tkinter
+        import tkinter.font
+        tk, font = tkinter, tkinter.font
+
+# A finished frame as handed from the render thread to a presenter
+RenderedFrame = namedtuple('RenderedFrame', 'rows number snapshot published_at')
+
+class FrameMailbox:
+    """Single-slot handoff that only ever holds the newest frame
+    
+    The render thread publishes, the presenting side takes. A frame that is
+    replaced before anyone took it is dropped and counted.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frame = None
+        self.published = 0
+        self.dropped = 0
+    
+    def publish(self, frame):
+        """Replace the waiting frame, if any, with a newer one"""
+        with self._lock:
+            if self._frame is not None:
+                self.dropped += 1
+            self._frame = frame
+            self.published += 1
+    
+    def take(self):
+        """Return the newest frame and empty the slot, or None if nothing is waiting"""
+        with self._lock:
+            frame, self._frame = self._frame, None
+        return frame
+
+class TextDiffPresenter:
+    """Show frames in a Text widget, only rewriting the rows that changed
+    
+    Uses plain Tk index and state strings, so anything with the Text
+    widget's config, delete and insert methods can stand in for it.
+    """
+    
+    def __init__(self, widget):
+        self.widget = widget
+        self.rows = []
+    
+    def present(self, rows):
+        """Show a list of row strings, returning how many rows were rewritten"""
+        if len(rows) != len(self.rows):
+            # Row count changed, so line numbers no longer line up: redraw all
+            self.widget.config(state='normal')
+            self.widget.delete('1.0', 'end')
+            self.widget.insert('end', '\n'.join(rows))
+            self.widget.config(state='disabled')
+            self.rows = list(rows)
+            return len(rows)
+        
+        changed = [i for i, (new, old) in enumerate(zip(rows, self.rows)) if new != old]
+        if not changed:
+            return 0
+        
+        self.widget.config(state='normal')
+        for i in changed:
+            line = i + 1
+            self.widget.delete(f'{line}.0', f'{line}.end')
+            self.widget.insert(f'{line}.0', rows[i])
+        self.widget.config(state='disabled')
+        
+        self.rows = list(rows)
+        return len(changed)
+
+# (width, height) in pixels of one character cell, by font name
+_character_cells = {}
+
+def character_cell(tk_font):
+    """Pixel size of one character cell of a monospace font, measured once per font"""
+    name = str(tk_font)
+    if name not in _character_cells:
+        _character_cells[name] = (tk_font.measure('M'), tk_font.metrics('linespace'))
+    return _character_cells[name]
+
+class ModernTerminalWindow:
+    def __init__(self, target_fps=24, frame_cache=None, frames=None, stats=None,
+                 unfocused_fps=8, hidden_fps=0, render_mode='continuous', mesh=CUBE_MESH):
+        import_tkinter()
+        self.root = tk.Tk()
+        self.root.title("3D ASCII Spinning Cube • Modern Terminal")
+        
+        # Modern color scheme
+        self.colors = {
+            'bg': '#1a1a1a',          # Dark charcoal background
+            'header_bg': '#2d2d2d',    # Slightly lighter for headers
+            'cube_bg': '#161616',      # Darker for cube area
+            'footer_bg': '#2d2d2d',    # Match header
+            'text': '#e0e0e0',        # Light gray text
+            'accent': '#4a9eff',      # Blue accent
+            'cube_text': '#b8b8b8',   # Gray cube text
+            'border': '#404040'        # Border color
+        }
+        
+        self.root.configure(bg=self.colors['bg'])
+        self.root.geometry("1200x800")
+        self.root.resizable(True, True)
+        
+        # Fonts
+        self.header_font = font.Font(family="Segoe UI", size=12, weight="bold")
+        self.info_font = font.Font(family="Segoe UI", size=10)
+        self.cube_font = font.Font(family="Courier New", size=9, weight="normal")
+        
+        # Create main container
+        self.main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        self.main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Create header section
+        self.create_header()
+        
+        # Create cube display area
+        self.create_cube_area()
+        
+        # Create footer section
+        self.create_footer()
+        
+        # Create the spinning cube
+        self.cube = SpinningCube(size=20, mesh=mesh)
+        
+        # Frames come from the live cube unless a precomputed loop is given
+        self.frames = frames if frames is not None else LiveFrames(self.cube, frame_cache)
+        
+        # Animation variables
+        self.animation_thread = None
+        # Canvas size in characters, replaced as one tuple so the render
+        # thread never sees a width from one resize and a height from another
+        self.canvas_size = (0, 0)
+        
+        # Resize events are coalesced until the window has settled
+        self.resize_delay = 150
+        self.resize_job = None
+        self.frame_count = 0
+        self.start_time = time.time()
+        self.clock = AnimationClock()
+        
+        # In continuous mode every tick renders. In on-demand mode frames are
+        # only rendered when invalidated, and a spinning clock is just one
+        # source of invalidations, so a paused cube costs nothing.
+        self.render_mode = render_mode
+        self.invalidation = Invalidation()
+        self.last_activity = time.monotonic()
+        
+        # Render thread publishes here; poll_frames presents on the Tk side
+        self.mailbox = FrameMailbox()
+        self.poll_interval = 10
+        self.idle_after = 0.5
+        self.latest_frame = None
+        self.poll_job = None
+        
+        # Status labels refresh on their own slow timer, not once per frame
+        self.status_interval = 250
+        self.label_text = {}
+        self.status_job = None
+        self.stats = stats if stats is not None else FrameStats()
+        self.scheduler = FrameScheduler(target_fps)
+        
+        # Power policy: the frame rate drops to unfocused_fps without focus
+        # (0 keeps the target rate) and to hidden_fps when nothing can be
+        # seen (0 pauses rendering)
+        self.target_fps = target_fps
+        self.unfocused_fps = unfocused_fps
+        self.hidden_fps = hidden_fps
+        self.mapped = True
+        self.obscured = False
+        self.focused = True
+        self.power_state = 'active'
+        
+        # Bind window resize events
+        self.root.bind('<Configure>', self.on_window_resize)
+        
+        # Adjust the target frame rate at runtime
+        self.root.bind('<plus>', lambda event: self.change_target_fps(6))
+        self.root.bind('<equal>', lambda event: self.change_target_fps(6))
+        self.root.bind('<minus>', lambda event: self.change_target_fps(-6))
+        
+        # Pause and resume the spin
+        self.root.bind('<space>', lambda event: self.toggle_clock())
+        
+        # Track whether the cube can be seen and whether the window has focus
+        self.root.bind('<Map>', self.on_map_change)
+        self.root.bind('<Unmap>', self.on_map_change)
+        self.cube_display.bind('<Visibility>', self.on_visibility)
+        self.root.bind('<FocusIn>', self.on_focus_change)
+        self.root.bind('<FocusOut>', self.on_focus_change)
+        
+        # Handle window closing
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # Start animation
+        self.start_animation()
+    
+    def create_header(self):
+        """Create the header section"""
+        self.header_frame = tk.Frame(self.main_frame, bg=self.colors['header_bg'], relief=tk.RAISED, bd=1)
+        self.header_frame.pack(fill=tk.X, pady=(0, 5))
+        
+        # Title
+        self.title_label = tk.Label(
+            self.header_frame, 
+            text="🎲 3D ASCII SPINNING CUBE",
+            font=self.header_font,
+            bg=self.colors['header_bg'],
+            fg=self.colors['accent'],
+            pady=10
+        )
+        self.title_label.pack()
+        
+        # Info row
+        self.info_frame = tk.Frame(self.header_frame, bg=self.colors['header_bg'])
+        self.info_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
+        
+        # Left info
+        self.left_info = tk.Label(
+            self.info_frame,
+            text="Initializing...",
+            font=self.info_font,
+            bg=self.colors['header_bg'],
+            fg=self.colors['text'],
+            anchor=tk.W
+        )
+        self.left_info.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Right info
+        self.right_info = tk.Label(
+            self.info_frame,
+            text="Ready",
+            font=self.info_font,
+            bg=self.colors['header_bg'],
+            fg=self.colors['text'],
+            anchor=tk.E
+        )
+        self.right_info.pack(side=tk.RIGHT, fill=tk.X, expand=True)
+    
+    def create_cube_area(self):
+        """Create the cube display area"""
+        self.cube_frame = tk.Frame(self.main_frame, bg=self.colors['cube_bg'], relief=tk.SUNKEN, bd=2)
+        self.cube_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        
+        # Cube display text widget
+        self.cube_display = tk.Text(
+            self.cube_frame,
+            bg=self.colors['cube_bg'],
+            fg=self.colors['cube_text'],
+            font=self.cube_font,
+            insertbackground=self.colors['cube_text'],
+            selectbackground=self.colors['border'],
+            selectforeground=self.colors['text'],
+            wrap=tk.NONE,
+            state=tk.DISABLED,
+            relief=tk.FLAT,
+            bd=0
+        )
+        
+        # Scrollbars for cube area
+        self.v_scrollbar = tk.Scrollbar(self.cube_frame, orient=tk.VERTICAL, command=self.cube_display.yview)
+        self.h_scrollbar = tk.Scrollbar(self.cube_frame, orient=tk.HORIZONTAL, command=self.cube_display.xview)
+        
+        self.cube_display.configure(yscrollcommand=self.v_scrollbar.set, xscrollcommand=self.h_scrollbar.set)
+        
+        # Pack scrollbars and display
+        self.v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.cube_display.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Rewrites only the rows that differ from the frame on screen
+        self.presenter = TextDiffPresenter(self.cube_display)
+    
+    def create_footer(self):
+        """Create the footer section"""
+        self.footer_frame = tk.Frame(self.main_frame, bg=self.colors['footer_bg'], relief=tk.RAISED, bd=1)
+        self.footer_frame.pack(fill=tk.X, pady=(5, 0))
+        
+        # Rotation info
+        self.rotation_label = tk.Label(
+            self.footer_frame,
+            text="Rotation: X=0.00, Y=0.00, Z=0.00",
+            font=self.info_font,
+            bg=self.colors['footer_bg'],
+            fg=self.colors['text'],
+            pady=8
+        )
+        self.rotation_label.pack()
+        
+        # Status row
+        self.status_frame = tk.Frame(self.footer_frame, bg=self.colors['footer_bg'])
+        self.status_frame.pack(fill=tk.X, padx=20, pady=(0, 8))
+        
+        # Status left
+        self.status_left = tk.Label(
+            self.status_frame,
+            text="Status: Running • Animation: Active",
+            font=self.info_font,
+            bg=self.colors['footer_bg'],
+            fg=self.colors['accent'],
+            anchor=tk.W
+        )
+        self.status_left.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Status right
+        self.status_right = tk.Label(
+            self.status_frame,
+            text="Resize window to adjust cube size",
+            font=self.info_font,
+            bg=self.colors['footer_bg'],
+            fg=self.colors['text'],
+            anchor=tk.E
+        )
+        self.status_right.pack(side=tk.RIGHT, fill=tk.X, expand=True)
+    
+    def on_window_resize(self, event):
+        """Handle window resize events once the window stops changing size"""
+        if event.widget == self.root:
+            # Until the job runs, the render thread keeps drawing at the old size
+            if self.resize_job is not None:
+                self.root.after_cancel(self.resize_job)
+            self.resize_job = self.root.after(self.resize_delay, self.update_dimensions)
+    
+    def update_dimensions(self):
+        """Update canvas dimensions based on window size"""
+        self.resize_job = None
+        char_width, char_height = character_cell(self.cube_font)
+        
+        # Get cube display area dimensions
+        widget_width = self.cube_display.winfo_width()
+        widget_height = self.cube_display.winfo_height()
+        
+        if widget_width > 0 and widget_height > 0:
+            width = max(40, widget_width // char_width)
+            height = max(20, widget_height // char_height)
+            if (width, height) == self.canvas_size:
+                return
+            
+            # The render thread refits the cube before its first frame at this size
+            self.canvas_size = (width, height)
+            self.invalidate('size')
+    
+    def update_cube_display(self, rows):
+        """Update the cube display area"""
+        self.presenter.present(rows)
+    
+    def update_header_info(self, frame):
+        """Update header information"""
+        elapsed = time.time() - self.start_time
+        
+        left_text = f"Window: {self.canvas_size[0]}×{self.canvas_size[1]} • Cube Size: {frame.snapshot.size} • Frame: {frame.number}"
+        frame_times = self.stats.percentiles('frame')
+        if frame_times is not None:
+            p50, p95, p99 = (value * 1000 for value in frame_times)
+            timing_text = f" • Frame p50/p95/p99: {p50:.1f}/{p95:.1f}/{p99:.1f}ms"
+        else:
+            timing_text = ""
+        right_text = f"Runtime: {elapsed:.1f}s • FPS: {self.stats.fps():.1f}{timing_text} • Dropped: {self.mailbox.dropped}"
+        
+        self.set_label(self.left_info, left_text)
+        self.set_label(self.right_info, right_text)
+    
+    def update_footer_info(self, frame):
+        """Update footer information"""
+        snapshot = frame.snapshot
+        rotation_text = f"Rotation: X={snapshot.angle_x:.2f}, Y={snapshot.angle_y:.2f}, Z={snapshot.angle_z:.2f}"
+        self.set_label(self.rotation_label, rotation_text)
+        source_text = self.frames.summary()
+        if source_text:
+            self.set_label(self.status_right, f"{source_text} • {self.stats.summary()}")
+        else:
+            self.set_label(self.status_right, self.stats.summary())
+        
+        spin = "Paused (space)" if self.clock.paused else "Spinning (space)"
+        status_text = f"Status: {self.power_state.capitalize()} • {spin} • Target: {self.scheduler.target_fps} FPS (+/-) • Missed: {self.scheduler.missed}"
+        self.set_label(self.status_left, status_text)
+    
+    def set_label(self, label, text):
+        """Configure a label's text, skipping the geometry work when it has not changed"""
+        if self.label_text.get(label) != text:
+            self.label_text[label] = text
+            label.config(text=text)
+    
+    def refresh_status(self):
+        """Update every header and footer label from the latest frame, then schedule the next refresh"""
+        if not self.cube.running:
+            return
+        
+        if self.latest_frame is not None and self.power_state != 'hidden':
+            self.update_header_info(self.latest_frame)
+            self.update_footer_info(self.latest_frame)
+        
+        # Nothing changes while the render thread is parked; poll_soon
+        # restarts the timer when it is woken
+        if self.parked():
+            self.status_job = None
+            return
+        self.status_job = self.root.after(self.status_interval, self.refresh_status)
+    
+    def change_target_fps(self, step):
+        """Raise or lower the target frame rate"""
+        self.target_fps = max(1, min(240, self.target_fps + step))
+        self.apply_power_policy()
+    
+    def invalidate(self, reason):
+        """Ask for a new frame, and poll quickly until it arrives"""
+        self.invalidation.invalidate(reason)
+        self.poll_soon()
+    
+    def parked(self):
+        """Whether the render thread waits for the Tk side to wake it before publishing again"""
+        return self.scheduler.paused or (self.render_mode == 'on-demand' and self.clock.paused)
+    
+    def toggle_clock(self):
+        """Pause or resume the spin"""
+        self.clock.toggle()
+        self.scheduler.reset()
+        self.invalidate('clock')
+    
+    def on_map_change(self, event):
+        """Note the window being iconified or restored"""
+        if event.widget == self.root:
+            self.mapped = event.type == tk.EventType.Map
+            self.apply_power_policy()
+    
+    def on_visibility(self, event):
+        """Note the cube area being fully covered by other windows or uncovered"""
+        self.obscured = event.state == 'VisibilityFullyObscured'
+        self.apply_power_policy()
+    
+    def on_focus_change(self, event):
+        """Re-check focus once Tk has finished moving it"""
+        # Focus events also fire as focus moves between our own widgets
+        self.root.after_idle(self.update_focus)
+    
+    def update_focus(self):
+        """Note whether any of our widgets has the keyboard focus"""
+        if not self.cube.running:
+            return
+        self.focused = self.root.focus_get() is not None
+        self.apply_power_policy()
+    
+    def apply_power_policy(self):
+        """Set the render rate for the current visibility and focus"""
+        if not self.mapped or self.obscured:
+            self.power_state, fps = 'hidden', self.hidden_fps
+        elif not self.focused:
+            self.power_state, fps = 'unfocused', self.unfocused_fps or self.target_fps
+        else:
+            self.power_state, fps = 'active', self.target_fps
+        
+        if fps <= 0:
+            self.scheduler.pause()
+            return
+        if fps != self.scheduler.target_fps:
+            self.scheduler.set_target_fps(fps)
+        if self.scheduler.paused:
+            self.scheduler.resume()
+            self.poll_soon()
+    
+    def poll_soon(self):
+        """Poll at the fast rate now that a frame is on its way, replacing a backed-off poll"""
+        self.last_activity = time.monotonic()
+        if self.poll_job is not None:
+            self.root.after_cancel(self.poll_job)
+        self.poll_job = self.root.after(self.poll_interval, self.poll_frames)
+        if self.status_job is None:
+            self.status_job = self.root.after(self.status_interval, self.refresh_status)
+    
+    def poll_frames(self):
+        """Present the newest published frame, if any, and poll again"""
+        if not self.cube.running:
+            return
+        
+        now = time.monotonic()
+        frame = self.mailbox.take()
+        if frame is not None:
+            self.last_activity = now
+            self.stats.record('queue', time.perf_counter() - frame.published_at)
+            with self.stats.measure('present'):
+                self.update_cube_display(frame.rows)
+            self.stats.mark_presented()
+            self.latest_frame = frame
+        
+        # Back off while no frames are coming, and stop once the render
+        # thread is parked; poll_soon restarts polling when it is woken
+        idle = now - self.last_activity > self.idle_after
+        if idle and self.parked():
+            self.poll_job = None
+            return
+        self.poll_job = self.root.after(self.status_interval if idle else self.poll_interval, self.poll_frames)
+    
+    def wait_for_frame(self):
+        """Block until the next frame should be rendered"""
+        if self.render_mode == 'continuous':
+            self.scheduler.wait()
+            return
+        
+        # A spinning clock invalidates once per tick; otherwise only
+        # resizes, unpausing and other changes wake the render thread
+        if not self.clock.paused:
+            self.scheduler.wait()
+            self.invalidation.invalidate('spin')
+        self.invalidation.wait()
+    
+    def size(self):
+        """Canvas size in characters, for the render thread"""
+        return self.canvas_size
+    
+    def present(self, cells, snapshot, stats):
+        """Hand a frame from the render thread to the Tk thread"""
+        # The cells may be reused, so convert them to rows here before
+        # handing them over. The snapshot travels with the frame, so the Tk
+        # side never reads the cube's mutable state, and it only ever sees
+        # the newest frame.
+        with stats.measure('stringify'):
+            rows = cells_to_rows(cells)
+        self.mailbox.publish(RenderedFrame(rows, self.frame_count, snapshot, time.perf_counter()))
+        self.frame_count += 1
+    
+    @property
+    def closed(self):
+        return not self.cube.running
+    
+    def close(self):
+        """Close the window"""
+        self.on_closing()
+    
+    def animate_cube(self):
+        """Animation loop for the spinning cube, run on the render thread"""
+        # Orientation follows the animation clock, so dropped frames do not
+        # slow the spin down
+        try:
+            drive(self, self.frames, self.wait_for_frame, self.stats, self.clock)
+        except Exception as e:
+            print(f"Animation error: {e}")
+    
+    def start_animation(self):
+        """Start the animation in a separate thread"""
+        self.root.after(100, self.update_dimensions)
+        self.poll_job = self.root.after(self.poll_interval, self.poll_frames)
+        self.status_job = self.root.after(self.status_interval, self.refresh_status)
+        
+        self.clock = AnimationClock()
+        self.animation_thread = threading.Thread(target=self.animate_cube, name='animation', daemon=True)
+        self.animation_thread.start()
+    
+    def on_closing(self):
+        """Handle window closing"""
+        self.cube.stop()
+        self.scheduler.resume()
+        self.invalidation.invalidate('close')
+        self.root.quit()
+        self.root.destroy()
+    
+    def run(self):
+        """Start the terminal window"""
+        self.root.mainloop()
@@ -0,0 +1,77 @@
+"""LRU cache of rendered frames keyed by quantized orientation"""
+import math
+import threading
+from collections import OrderedDict
+
+from .geometry import CUBE_MESH
+from .scene import render_snapshot
+
+class FrameCache:
+    """Opt-in LRU cache of rendered frames for one mesh
+    
+    Frames are keyed by the snapshot's angles quantized to angle_steps per
+    turn, plus canvas size, cube size and camera. Misses are rendered from
+    the quantized snapshot, so a cached frame is exactly what rendering its
+    key would produce. The least recently used frames are evicted once the
+    cached cells exceed max_bytes.
+    """
+    
+    def __init__(self, max_bytes, mesh=CUBE_MESH, angle_steps=360):
+        self._lock = threading.Lock()
+        self._frames = OrderedDict()
+        self.max_bytes = max_bytes
+        self.mesh = mesh
+        self.angle_steps = angle_steps
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def quantize(self, snapshot):
+        """Snap a snapshot's angles to the cache grid"""
+        step = 2 * math.pi / self.angle_steps
+        return snapshot._replace(
+            angle_x=round(snapshot.angle_x / step) % self.angle_steps * step,
+            angle_y=round(snapshot.angle_y / step) % self.angle_steps * step,
+            angle_z=round(snapshot.angle_z / step) % self.angle_steps * step
+        )
+    
+    def key(self, snapshot, canvas_width, canvas_height):
+        """Cache key of a snapshot rendered at a canvas size"""
+        step = 2 * math.pi / self.angle_steps
+        angles = tuple(round(angle / step) % self.angle_steps for angle in snapshot[:3])
+        return angles + (canvas_width, canvas_height) + tuple(snapshot[3:])
+    
+    def render(self, snapshot, canvas_width, canvas_height, stats=None):
+        """Return the read-only cells for a snapshot, rendering them on a miss"""
+        key = self.key(snapshot, canvas_width, canvas_height)
+        with self._lock:
+            cells = self._frames.get(key)
+            if cells is not None:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return cells
+            self.misses += 1
+        
+        cells = render_snapshot(self.quantize(snapshot), canvas_width, canvas_height,
+                                self.mesh, stats=stats).cells
+        cells.setflags(write=False)
+        if cells.nbytes > self.max_bytes:
+            return cells
+        
+        with self._lock:
+            if key not in self._frames:
+                self._frames[key] = cells
+                self.nbytes += cells.nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._frames.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+                self.evictions += 1
+        return cells
+    
+    def summary(self):
+        """One line with the hit rate and memory use"""
+        lookups = self.hits + self.misses
+        hit_rate = 100.0 * self.hits / lookups if lookups else 0.0
+        return (f"Cache: {hit_rate:.0f}% hits ({self.hits}/{lookups}), "
+                f"{len(self._frames)} frames, {self.nbytes / 2**20:.1f} MiB")
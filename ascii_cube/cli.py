@@ -0,0 +1,167 @@
+"""Command line entry point"""
+import argparse
+import sys
+import time
+from contextlib import nullcontext
+
+from . import backends
+from .cache import FrameCache
+from .geometry import CUBE_MESH
+from .scene import LiveFrames, SpinningCube
+from .timing import FrameStats
+
+# Recording, playback, OBJ loading and profiling are imported in the
+# branches that use them, so a plain run only pays for what it touches
+
+def parse_size(text):
+    """Parse a WIDTHxHEIGHT canvas size"""
+    try:
+        width, height = (int(part) for part in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {text!r}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"size must be positive, got {text!r}")
+    return width, height
+
+def parse_positive_int(text):
+    """Parse a whole number greater than zero"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a whole number, got {text!r}")
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be positive, got {text!r}")
+    return value
+
+def parse_non_negative_int(text):
+    """Parse a whole number that is zero or greater"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a whole number, got {text!r}")
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {text!r}")
+    return value
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="3D ASCII spinning cube")
+    parser.add_argument('--backend', choices=('tk', 'ansi', 'curses', 'null'), default='tk',
+                        help="tk opens a window, ansi and curses draw to this terminal, null renders "
+                             "--frames frames at --size and discards them to measure throughput (default: tk)")
+    parser.add_argument('--fps', type=parse_positive_int, default=24,
+                        help="target frame rate (default: 24)")
+    parser.add_argument('--frame-cache', type=float, default=0, metavar='MB',
+                        help="cache up to MB megabytes of rendered frames (default: off)")
+    
+    recording = parser.add_argument_group("offline recording")
+    recording.add_argument('--record', metavar='PATH',
+                           help="render to an asciicast v2 (.cast) or plain text file instead of a window")
+    recording.add_argument('--frames', type=parse_positive_int, default=240,
+                           help="number of frames to record or to render with --backend null (default: 240)")
+    recording.add_argument('--size', type=parse_size, default=(80, 24), metavar='WxH',
+                           help="canvas size of the recording (default: 80x24)")
+    recording.add_argument('--jobs', type=parse_positive_int, default=None,
+                           help="worker processes (default: one per CPU)")
+    recording.add_argument('--write-loop', metavar='PATH',
+                           help="precompute one seamless animation loop at --size and --fps into a frame file")
+    parser.add_argument('--mesh', metavar='PATH',
+                        help="spin a Wavefront OBJ model instead of the cube; parsed arrays are "
+                             "cached next to it in PATH.npz")
+    parser.add_argument('--play-loop', metavar='PATH',
+                        help="play a frame file written by --write-loop instead of rendering")
+    parser.add_argument('--render-mode', choices=('continuous', 'on-demand'), default='continuous',
+                        help="render every tick, or only when something visible changed; "
+                             "space pauses the spin (Tk backend, default: continuous)")
+    parser.add_argument('--unfocused-fps', type=parse_non_negative_int, default=8, metavar='FPS',
+                        help="frame rate while the Tk window is unfocused; 0 keeps the full rate (default: 8)")
+    parser.add_argument('--hidden-fps', type=parse_non_negative_int, default=0, metavar='FPS',
+                        help="frame rate while the Tk window is minimized or covered; 0 pauses (default: 0)")
+    parser.add_argument('--profile', nargs='?', const='cube-profile', metavar='PREFIX',
+                        help="sample stacks while running and write PREFIX.folded and PREFIX.trace.json "
+                             "(default prefix: cube-profile)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main function to create and run the terminal window"""
+    args = parse_args(argv)
+    try:
+        if args.mesh:
+            from .mesh import load_obj
+            mesh = load_obj(args.mesh)
+        else:
+            mesh = CUBE_MESH
+        frame_cache = FrameCache(int(args.frame_cache * 2**20), mesh) if args.frame_cache > 0 else None
+        
+        if args.write_loop:
+            from .record import write_loop_file
+            width, height = args.size
+            started = time.perf_counter()
+            frames = write_loop_file(args.write_loop, width, height, fps=args.fps, jobs=args.jobs, mesh=mesh)
+            print(f"Wrote a {frames} frame loop to {args.write_loop} in {time.perf_counter() - started:.1f}s")
+            return
+        if args.record:
+            from .record import record_animation
+            width, height = args.size
+            started = time.perf_counter()
+            record_animation(args.record, args.frames, width, height, fps=args.fps, jobs=args.jobs, mesh=mesh)
+            print(f"Wrote {args.frames} frames to {args.record} in {time.perf_counter() - started:.1f}s")
+            return
+        if args.play_loop:
+            from .record import LoopFile
+            frames = LoopFile(args.play_loop)
+            target_fps = round(frames.fps)
+        else:
+            frames = None
+            target_fps = args.fps
+        
+        if args.profile:
+            from .profiler import profiling
+            session = profiling(args.profile)
+        else:
+            session = nullcontext(FrameStats())
+        
+        with session as stats:
+            if args.backend == 'null':
+                if frames is None:
+                    frames = LiveFrames(SpinningCube(size=20, mesh=mesh), frame_cache)
+                width, height = args.size
+                started = time.perf_counter()
+                count = backends.drive(backends.NullBackend(width, height), frames, stats=stats,
+                                       timestep=1 / target_fps, max_frames=args.frames)
+                seconds = time.perf_counter() - started
+                print(f"Rendered {count} frames at {width}x{height} in {seconds:.2f}s ({count / seconds:.0f} FPS)")
+                print(stats.summary())
+                if frames.summary():
+                    print(frames.summary())
+                return
+            
+            if args.backend in ('ansi', 'curses'):
+                if frames is None:
+                    frames = LiveFrames(SpinningCube(size=20, mesh=mesh), frame_cache)
+                terminal = backends.AnsiTerminal() if args.backend == 'ansi' else backends.CursesTerminal()
+                terminal.run(frames, target_fps=target_fps, stats=stats)
+                if frames.summary():
+                    print(frames.summary())
+                return
+            
+            print("🎲 Starting Modern 3D ASCII Spinning Cube Interface...")
+            print("Opening minimalistic terminal window...")
+            print("Features: Responsive sizing, dedicated sections, modern UI")
+            print("Close the window to exit.")
+            
+            terminal = backends.ModernTerminalWindow(target_fps=target_fps, frame_cache=frame_cache,
+                                                     frames=frames, stats=stats,
+                                                     unfocused_fps=args.unfocused_fps, hidden_fps=args.hidden_fps,
+                                                     render_mode=args.render_mode, mesh=mesh)
+            terminal.run()
+    
+    except KeyboardInterrupt:
+        print("\n🎲 Animation stopped by user.")
+        sys.exit(0)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Meshes, rotation and projection matrices and near-plane clipping"""
+import math
+from collections import namedtuple
+
+import numpy as np
+
+# Homogeneous (N, 4) vertices, (M, 2) vertex index pairs and one glyph
+# codepoint per edge and per vertex; a mesh without vertex markers has
+# no vertex codes at all
+Mesh = namedtuple('Mesh', 'vertices edges edge_codes vertex_codes')
+
+def make_mesh(vertices, edges, edge_codes, vertex_codes):
+    """Build a read-only Mesh from plain vertex, edge and glyph sequences"""
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+    mesh = Mesh(
+        np.hstack((vertices, np.ones((len(vertices), 1)))),
+        np.asarray(edges, dtype=np.intp).reshape(-1, 2),
+        np.asarray(edge_codes, dtype=np.uint32),
+        np.asarray(vertex_codes, dtype=np.uint32)
+    )
+    for array in mesh:
+        array.setflags(write=False)
+    return mesh
+
+# Define cube vertices (8 corners of a cube)
+CUBE_VERTICES = [
+    [-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1],  # Back face
+    [-1, -1, 1], [1, -1, 1], [1, 1, 1], [-1, 1, 1]       # Front face
+]
+
+# Define cube edges (which vertices connect)
+CUBE_EDGES = [
+    [0, 1], [1, 2], [2, 3], [3, 0],  # Back face
+    [4, 5], [5, 6], [6, 7], [7, 4],  # Front face
+    [0, 4], [1, 5], [2, 6], [3, 7]   # Connecting edges
+]
+
+def _cube_edge_glyph(start, end):
+    """Choose character based on edge orientation for visual effect"""
+    if start < 4 and end < 4:  # Back face
+        return ord('·')
+    if start >= 4 and end >= 4:  # Front face
+        return ord('█')
+    return ord('▓')  # Connecting edges
+
+CUBE_MESH = make_mesh(
+    CUBE_VERTICES,
+    CUBE_EDGES,
+    [_cube_edge_glyph(start, end) for start, end in CUBE_EDGES],
+    [ord('●' if i >= 4 else '○') for i in range(len(CUBE_VERTICES))]
+)
+
+def rotation_matrix(angle_x, angle_y, angle_z):
+    """Compose the X, Y and Z rotations of SpinningCube.rotate_point into one 3x3 matrix"""
+    cos_x, sin_x = math.cos(angle_x), math.sin(angle_x)
+    cos_y, sin_y = math.cos(angle_y), math.sin(angle_y)
+    cos_z, sin_z = math.cos(angle_z), math.sin(angle_z)
+    
+    rot_x = np.array([[1, 0, 0], [0, cos_x, -sin_x], [0, sin_x, cos_x]])
+    rot_y = np.array([[cos_y, 0, sin_y], [0, 1, 0], [-sin_y, 0, cos_y]])
+    rot_z = np.array([[cos_z, -sin_z, 0], [sin_z, cos_z, 0], [0, 0, 1]])
+    
+    # X is applied first, then Y, then Z
+    return rot_z @ rot_y @ rot_x
+
+def frame_matrix(snapshot):
+    """Build the 4x4 rotation + perspective matrix for a snapshot"""
+    distance = snapshot.camera_distance
+    scale = distance * snapshot.size
+    
+    model = np.eye(4)
+    model[:3, :3] = rotation_matrix(snapshot.angle_x, snapshot.angle_y, snapshot.angle_z)
+    
+    # Maps (x, y, z, 1) to (x*d*size, y*d*size, z, d + z); dividing by the
+    # last component gives the same result as SpinningCube.project_3d_to_2d
+    projection = np.array([
+        [scale, 0, 0, 0],
+        [0, scale, 0, 0],
+        [0, 0, 1, 0],
+        [0, 0, 1, distance]
+    ], dtype=np.float64)
+    
+    return projection @ model
+
+def clip_near_plane(starts, ends, near):
+    """Clip homogeneous segments so both endpoints satisfy w >= near
+    
+    Returns the clipped starts and ends plus a mask of the input segments
+    that are at least partly in front of the plane.
+    """
+    keep = (starts[:, 3] >= near) | (ends[:, 3] >= near)
+    starts = starts[keep].copy()
+    ends = ends[keep].copy()
+    
+    # At most one endpoint of a kept segment is behind the plane; slide it
+    # along the segment until it lies exactly on the plane
+    start_w = starts[:, 3].copy()
+    end_w = ends[:, 3].copy()
+    behind = start_w < near
+    t = (near - start_w[behind]) / (end_w[behind] - start_w[behind])
+    starts[behind] += t[:, None] * (ends[behind] - starts[behind])
+    behind = end_w < near
+    t = (near - end_w[behind]) / (start_w[behind] - end_w[behind])
+    ends[behind] += t[:, None] * (starts[behind] - ends[behind])
+    
+    return starts, ends, keep
+
+def perspective_divide(points, center_x, center_y):
+    """Turn homogeneous points into centered screen coordinates"""
+    # Truncate toward zero like int() before centering
+    screen = np.trunc(points[:, :2] / points[:, 3:4])
+    screen += (center_x, center_y)
+    return screen
@@ -0,0 +1,110 @@
+"""Wavefront OBJ meshes, with a binary sidecar cache of the parsed arrays"""
+import hashlib
+import os
+
+import numpy as np
+
+from .geometry import make_mesh
+
+# Loaded meshes draw every edge with one glyph and have no vertex markers
+OBJ_EDGE_GLYPH = ord('▓')
+
+# Bump when the sidecar layout or the parsing rules change
+SIDECAR_VERSION = 1
+
+def file_sha256(path):
+    """Hex SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as stream:
+        for chunk in iter(lambda: stream.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def parse_obj(path):
+    """Read an OBJ file's vertex positions and the deduplicated edges of its faces and lines
+    
+    Texture coordinates, normals, groups and materials are skipped. Face
+    indices may be v, v/vt, v//vn or v/vt/vn and may be negative, counting
+    back from the most recent vertex.
+    """
+    vertices = []
+    pairs = []
+    with open(path, encoding='utf-8', errors='replace') as stream:
+        for number, line in enumerate(stream, 1):
+            parts = line.split()
+            if not parts:
+                continue
+            kind = parts[0]
+            if kind == 'v':
+                try:
+                    if len(parts) < 4:
+                        raise ValueError
+                    vertices.append([float(part) for part in parts[1:4]])
+                except ValueError:
+                    raise ValueError(f"{path}:{number}: expected x y z in {line.strip()!r}")
+            elif kind in ('f', 'l'):
+                try:
+                    indices = [int(part.split('/', 1)[0]) for part in parts[1:]]
+                except ValueError:
+                    raise ValueError(f"{path}:{number}: bad index in {line.strip()!r}")
+                indices = [index - 1 if index > 0 else len(vertices) + index for index in indices]
+                pairs.extend(zip(indices, indices[1:]))
+                # Faces are closed polygons, lines are open polylines
+                if kind == 'f' and len(indices) > 2:
+                    pairs.append((indices[-1], indices[0]))
+    
+    vertices = np.array(vertices, dtype=np.float64).reshape(-1, 3)
+    edges = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+    if edges.size and (edges.min() < 0 or edges.max() >= len(vertices)):
+        raise ValueError(f"{path}: an element refers to a vertex outside the {len(vertices)} defined")
+    
+    # Shared edges appear once per face; keep one copy, in either direction
+    edges.sort(axis=1)
+    edges = np.unique(edges[edges[:, 0] != edges[:, 1]], axis=0)
+    return normalize_vertices(vertices).astype(np.float32), edges.astype(np.uint32)
+
+def normalize_vertices(vertices):
+    """Center vertices on their bounding box and scale them into [-1, 1], the cube's extent"""
+    if not len(vertices):
+        return vertices
+    low, high = vertices.min(axis=0), vertices.max(axis=0)
+    half_extent = (high - low).max() / 2
+    return (vertices - (low + high) / 2) / (half_extent if half_extent > 0 else 1)
+
+def obj_mesh(vertices, edges):
+    """Build a Mesh from parsed OBJ arrays"""
+    return make_mesh(vertices, edges, np.full(len(edges), OBJ_EDGE_GLYPH), [])
+
+def load_obj(path, cache=True):
+    """Load an OBJ file as a Mesh
+    
+    The parsed arrays are kept in a PATH.npz sidecar keyed by the file's
+    SHA-256, so reopening an unchanged model skips the text parsing. A
+    missing, stale or unreadable sidecar is rebuilt; one that cannot be
+    written is simply skipped.
+    """
+    if not cache:
+        return obj_mesh(*parse_obj(path))
+    
+    digest = file_sha256(path)
+    sidecar = path + '.npz'
+    try:
+        with np.load(sidecar) as data:
+            if int(data['version']) == SIDECAR_VERSION and str(data['sha256']) == digest:
+                return obj_mesh(data['vertices'], data['edges'])
+    except Exception:
+        # Missing, truncated or corrupt: np.load raises anything from
+        # OSError to EOFError or BadZipFile, and all of them are a miss
+        pass
+    
+    vertices, edges = parse_obj(path)
+    # Write under a temporary name, so a concurrent reader never sees half a file
+    temporary = f"{sidecar}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, 'wb') as stream:
+            np.savez(stream, version=SIDECAR_VERSION, sha256=digest, vertices=vertices, edges=edges)
+        os.replace(temporary, sidecar)
+    except OSError:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+    return obj_mesh(vertices, edges)
@@ -0,0 +1,95 @@
+"""Self-checks for the OBJ loader and its .npz sidecar cache
+
+Covers parsing, the sidecar round trip, rebuilding stale, truncated or
+corrupt sidecars and reporting malformed lines:
+
+    python -m ascii_cube.mesh_check
+"""
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from .mesh import SIDECAR_VERSION, file_sha256, load_obj
+
+# A unit square as a quad and a triangle; the triangle uses negative
+# indices and repeats two of the quad's edges
+SQUARE_OBJ = """\
+v 0 0 0
+v 2 0 0
+v 2 2 0
+v 0 2 0
+vt 0 0
+vn 0 0 1
+f 1/1/1 2/1/1 3//1 4
+f -4 -2 -1
+"""
+SQUARE_EDGES = [[0, 1], [0, 2], [0, 3], [1, 2], [2, 3]]
+
+def check_mesh_loader():
+    """Check load_obj and its sidecar cache, returning a list of problems"""
+    problems = []
+    
+    def expect(condition, message):
+        if not condition:
+            problems.append(message)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'square.obj')
+        sidecar = path + '.npz'
+        with open(path, 'w', encoding='utf-8') as stream:
+            stream.write(SQUARE_OBJ)
+        
+        parsed = load_obj(path)
+        expect(parsed.edges.tolist() == SQUARE_EDGES, f"parsed edges {parsed.edges.tolist()}")
+        expect(np.abs(parsed.vertices[:, :2]).max() == 1, "vertices not normalized to [-1, 1]")
+        expect(len(parsed.vertex_codes) == 0, "loaded mesh has vertex markers")
+        expect(os.path.exists(sidecar), "no sidecar written")
+        
+        # Round trip: the second load comes from the sidecar
+        cached = load_obj(path)
+        expect(all(np.array_equal(a, b) for a, b in zip(parsed, cached)), "sidecar round trip changed the mesh")
+        
+        # Stale: a changed file is parsed again and the sidecar replaced
+        with open(path, 'a', encoding='utf-8') as stream:
+            stream.write("v 4 4 4\nl 3 5\n")
+        stale = load_obj(path)
+        expect(len(stale.vertices) == 5 and len(stale.edges) == 6, "stale sidecar was used")
+        with np.load(sidecar) as data:
+            expect(str(data['sha256']) == file_sha256(path) and int(data['version']) == SIDECAR_VERSION,
+                   "stale sidecar was not replaced")
+        
+        # Truncated or garbage sidecars are rebuilt
+        for label, damage in (('truncated', lambda data: data[:100]), ('corrupt', lambda data: b'junk' * 64)):
+            with open(sidecar, 'rb') as stream:
+                data = stream.read()
+            with open(sidecar, 'wb') as stream:
+                stream.write(damage(data))
+            try:
+                rebuilt = load_obj(path)
+                expect(all(np.array_equal(a, b) for a, b in zip(stale, rebuilt)), f"{label} sidecar changed the mesh")
+            except Exception as e:
+                problems.append(f"{label} sidecar: {type(e).__name__}: {e}")
+        
+        # Malformed vertex lines name the file and line
+        with open(path, 'a', encoding='utf-8') as stream:
+            stream.write("v 1 2\n")
+        try:
+            load_obj(path)
+            problems.append("short vertex line accepted")
+        except ValueError as e:
+            expect(f"{path}:11:" in str(e), f"short vertex line reported as {e}")
+    
+    return problems
+
+def main():
+    """Run the checks, printing each problem; returns a non-zero exit status on failure"""
+    problems = check_mesh_loader()
+    for problem in problems:
+        print(problem)
+    print("ok" if not problems else f"{len(problems)} problem(s)")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
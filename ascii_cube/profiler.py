@@ -0,0 +1,123 @@
+"""Sampling profiler and Chrome trace export for --profile"""
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+
+from .timing import FrameStats
+
+class TraceRecorder:
+    """Collects stage spans and writes them as Chrome trace-event JSON
+    
+    Only the most recent max_events spans are kept. Load the output in
+    chrome://tracing or Perfetto.
+    """
+    
+    def __init__(self, max_events=200000):
+        self.events = deque(maxlen=max_events)
+        self.origin = time.perf_counter()
+    
+    def add_span(self, name, start, seconds):
+        """Record a span of the calling thread; start is a perf_counter value"""
+        self.events.append((name, start, seconds, threading.get_ident()))
+    
+    def write(self, path):
+        """Write the spans as a complete-event trace file"""
+        pid = os.getpid()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        events = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': ident, 'args': {'name': name}}
+            for ident, name in names.items()
+        ]
+        for name, start, seconds, ident in list(self.events):
+            events.append({
+                'name': name,
+                'cat': 'frame',
+                'ph': 'X',
+                'ts': (start - self.origin) * 1e6,
+                'dur': seconds * 1e6,
+                'pid': pid,
+                'tid': ident
+            })
+        with open(path, 'w', encoding='utf-8') as stream:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, stream)
+
+class SamplingProfiler:
+    """Samples the Python stacks of every other thread from a background thread
+    
+    Unlike cProfile this adds no cost to the code being measured beyond the
+    sampler taking the GIL interval times a second. Stacks are counted in
+    collapsed form, one line per distinct stack, as flamegraph.pl and
+    speedscope expect.
+    """
+    
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._labels = {}
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        """Start sampling"""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='profiler', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop sampling and wait for the sampler thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+    
+    def _label(self, code):
+        """Flame graph frame name for a code object, cached"""
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            label = self._labels[code] = label.replace(';', ':')
+        return label
+    
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+    
+    def write_collapsed(self, path):
+        """Write the counted stacks in collapsed (folded) format"""
+        with open(path, 'w', encoding='utf-8') as stream:
+            for stack, count in self.stacks.most_common():
+                stream.write(f"{stack} {count}\n")
+
+@contextmanager
+def profiling(prefix):
+    """Yield the FrameStats a front end should use, profiling it when prefix is set"""
+    if prefix is None:
+        yield FrameStats()
+        return
+    
+    profiler = SamplingProfiler()
+    trace = TraceRecorder()
+    profiler.start()
+    try:
+        yield FrameStats(trace=trace)
+    finally:
+        profiler.stop()
+        profiler.write_collapsed(f"{prefix}.folded")
+        trace.write(f"{prefix}.trace.json")
+        print(f"Profile: {profiler.samples} samples in {prefix}.folded, "
+              f"{len(trace.events)} spans in {prefix}.trace.json")
@@ -0,0 +1,151 @@
+"""Offline rendering: process-pool recordings and precomputed loop files"""
+import math
+import os
+import struct
+from collections import deque
+from fractions import Fraction
+
+import numpy as np
+
+from .geometry import CUBE_MESH
+from .scene import CubeSnapshot, SpinningCube, render_snapshot
+
+class LoopFile:
+    """Frame source that plays a precomputed animation loop from a memory-mapped file
+    
+    The file is a fixed-size header followed by one record per frame, each
+    height x width uint32 codepoints. Frames are views into the mapping, so
+    playback copies nothing and several players share the page cache.
+    """
+    
+    MAGIC = b'CUBELOOP'
+    VERSION = 1
+    HEADER_FORMAT = '<8sIIIIdddddddd'
+    HEADER_SIZE = 128
+    
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as stream:
+            header = stream.read(struct.calcsize(self.HEADER_FORMAT))
+        if len(header) < struct.calcsize(self.HEADER_FORMAT):
+            raise ValueError(f"{path} is too short to be a loop file")
+        (magic, version, self.width, self.height, self.frame_count, self.fps, self.period,
+         size, distance, near, *velocity) = struct.unpack(self.HEADER_FORMAT, header)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(f"{path} is not a version {self.VERSION} loop file")
+        
+        self.camera = (size, distance, near)
+        self.angular_velocity = tuple(velocity)
+        self.records = np.memmap(path, dtype=np.uint32, mode='r', offset=self.HEADER_SIZE,
+                                 shape=(self.frame_count, self.height, self.width))
+    
+    def fit(self, canvas_width, canvas_height):
+        """Frames have a fixed size; larger canvases show them top-left, smaller ones crop them"""
+    
+    def index_at(self, elapsed):
+        """Frame number shown after elapsed seconds of playback"""
+        return int(elapsed * self.fps) % self.frame_count
+    
+    def snapshot(self, number):
+        """The CubeSnapshot frame number was rendered from"""
+        elapsed = number * self.period / self.frame_count
+        angles = ((velocity * elapsed) % (2 * math.pi) for velocity in self.angular_velocity)
+        return CubeSnapshot(*angles, *self.camera)
+    
+    def frame(self, elapsed, canvas_width, canvas_height, stats=None):
+        """Look up the frame for elapsed seconds of playback, as a view into the file"""
+        number = self.index_at(elapsed)
+        return self.records[number, :canvas_height, :canvas_width], self.snapshot(number)
+    
+    def summary(self):
+        """Status line for the source"""
+        return f"Loop: {self.frame_count} frames at {self.width}×{self.height}"
+
+# Mesh render_cells draws in a worker process, set once by the pool initializer
+_worker_mesh = CUBE_MESH
+
+def _init_worker(mesh):
+    """Pool initializer: keep the mesh for every task this worker runs"""
+    global _worker_mesh
+    _worker_mesh = mesh
+
+def render_cells(snapshot, width, height):
+    """Render a snapshot of the worker's mesh and return just its cells, for worker processes"""
+    return render_snapshot(snapshot, width, height, _worker_mesh).cells
+
+def record_animation(path, frames, width, height, fps=24, jobs=None, mesh=CUBE_MESH):
+    """Render frames of the animation in a process pool and write them in order
+    
+    Writes an asciicast v2 recording when path ends in .cast and plain text
+    frames otherwise. At most a few frames per worker are in flight, so
+    memory stays flat however long the recording is.
+    """
+    cube = SpinningCube()
+    cube.fit_to_canvas(width, height)
+    snapshots = [cube.snapshot_at(number / fps) for number in range(frames)]
+    
+    from .backends.recorder import RecorderBackend
+    recorder = RecorderBackend(path, width, height, fps)
+    try:
+        for cells in render_in_pool(snapshots, width, height, jobs, mesh):
+            recorder.present(cells)
+    finally:
+        recorder.close()
+
+def render_in_pool(snapshots, width, height, jobs=None, mesh=CUBE_MESH):
+    """Render snapshots of a mesh across worker processes, yielding their cells in order"""
+    # multiprocessing is slow to import, so only pay for it when rendering
+    from concurrent.futures import ProcessPoolExecutor
+    
+    jobs = jobs or os.cpu_count() or 1
+    in_flight = jobs * 4
+    
+    # Workers get immutable snapshots, so they share no state with us. The
+    # mesh is sent once per worker rather than with every snapshot.
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(mesh,)) as pool:
+        pending = deque()
+        snapshots = iter(snapshots)
+        for snapshot in snapshots:
+            pending.append(pool.submit(render_cells, snapshot, width, height))
+            # Keep the pool busy while results are consumed in order
+            if len(pending) >= in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def loop_period(angular_velocity):
+    """Shortest time, in seconds, after which all three angles are back where they started"""
+    # With each rate as a fraction p/q of radians per second, the loop is
+    # 2pi * lcm(q) / gcd(p) seconds long
+    rates = [Fraction(abs(rate)).limit_denominator(10**6) for rate in angular_velocity if rate]
+    if not rates:
+        return 0.0
+    numerator = math.gcd(*(rate.numerator for rate in rates))
+    denominator = math.lcm(*(rate.denominator for rate in rates))
+    return 2 * math.pi * denominator / numerator
+
+def write_loop_file(path, width, height, fps=24, jobs=None, mesh=CUBE_MESH):
+    """Precompute one full animation loop into a LoopFile and return its frame count"""
+    cube = SpinningCube()
+    cube.fit_to_canvas(width, height)
+    period = loop_period(cube.angular_velocity)
+    frames = max(1, round(period * fps))
+    
+    # Spread the frames evenly over the period so the loop is seamless
+    snapshots = [cube.snapshot_at(number * period / frames) for number in range(frames)]
+    
+    header = struct.pack(
+        LoopFile.HEADER_FORMAT, LoopFile.MAGIC, LoopFile.VERSION, width, height, frames,
+        fps, period, cube.size, cube.camera_distance, cube.near_plane, *cube.angular_velocity
+    )
+    with open(path, 'wb') as stream:
+        stream.write(header.ljust(LoopFile.HEADER_SIZE, b'\0'))
+        stream.truncate(LoopFile.HEADER_SIZE + frames * width * height * 4)
+    
+    records = np.memmap(path, dtype=np.uint32, mode='r+', offset=LoopFile.HEADER_SIZE,
+                        shape=(frames, height, width))
+    for number, cells in enumerate(render_in_pool(snapshots, width, height, jobs, mesh)):
+        records[number] = cells
+    records.flush()
+    del records
+    return frames
@@ -0,0 +1,216 @@
+"""The spinning cube scene and the pure render pipeline"""
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from .geometry import (
+    CUBE_MESH,
+    clip_near_plane,
+    frame_matrix,
+    perspective_divide,
+)
+from .raster import FrameBuffer, bresenham_offset, visible_steps
+from .timing import _no_measure
+
+# Everything a frame depends on besides the mesh and canvas size. Snapshots
+# are immutable, so any thread or process can render any of them.
+CubeSnapshot = namedtuple('CubeSnapshot', 'angle_x angle_y angle_z size camera_distance near_plane')
+
+def render_snapshot(snapshot, canvas_width, canvas_height, mesh=CUBE_MESH, framebuffer=None, stats=None):
+    """Render a snapshot of a mesh centered on a canvas and return the framebuffer
+    
+    This reads nothing but its arguments. Pass a framebuffer to reuse its
+    cells, otherwise a new one is allocated. When a FrameStats is given,
+    the transform and rasterize stages are timed.
+    """
+    measure = stats.measure if stats is not None else _no_measure
+    
+    # Calculate center offset for centering the cube
+    center_x = canvas_width // 2
+    center_y = canvas_height // 2
+    
+    with measure('transform'):
+        # Rotate and project all vertices in one batch
+        clip = mesh.vertices @ frame_matrix(snapshot).T
+        
+        # Clip edges against the near plane in 3D; draw_lines clips them
+        # to the canvas, so raster work is bounded by the visible area
+        starts, ends, kept = clip_near_plane(
+            clip[mesh.edges[:, 0]], clip[mesh.edges[:, 1]], snapshot.near_plane
+        )
+        starts = perspective_divide(starts, center_x, center_y).astype(np.intp)
+        ends = perspective_divide(ends, center_x, center_y).astype(np.intp)
+        if len(mesh.vertex_codes):
+            front = clip[:, 3] >= snapshot.near_plane
+            points = perspective_divide(clip[front], center_x, center_y).astype(np.intp)
+    
+    with measure('rasterize'):
+        # Reuse the caller's framebuffer, reallocating only on resize
+        if framebuffer is None:
+            framebuffer = FrameBuffer(canvas_width, canvas_height)
+        canvas = framebuffer
+        canvas.resize(canvas_width, canvas_height)
+        canvas.clear()
+        
+        # Draw all edges, then the vertices in front of the camera on top
+        canvas.draw_lines(starts, ends, mesh.edge_codes[kept])
+        if len(mesh.vertex_codes):
+            canvas.plot(points[:, 0], points[:, 1], mesh.vertex_codes[front])
+    
+    return canvas
+
+class SpinningCube:
+    def __init__(self, size=30, mesh=CUBE_MESH):
+        self.size = size
+        self.angle_x = 0
+        self.angle_y = 0
+        self.angle_z = 0
+        self.running = True
+        self.camera_distance = 5
+        self.near_plane = 0.1
+        
+        # Spin rates in radians per second (the old per-frame steps at 24 FPS)
+        self.angular_velocity = (1.2, 1.68, 0.72)
+        self.framebuffer = FrameBuffer(0, 0)
+        
+        # Geometry is shared and read-only; the cube only owns its pose
+        self.mesh = mesh
+    
+    def update_size(self, new_size):
+        """Update cube size dynamically"""
+        self.size = new_size
+    
+    def fit_to_canvas(self, canvas_width, canvas_height):
+        """Pick the cube size that suits a canvas of the given dimensions"""
+        available_space = min(canvas_width, canvas_height)
+        self.update_size(max(10, min(35, available_space // 3)))
+    
+    def snapshot(self):
+        """Capture the current orientation and camera as an immutable CubeSnapshot"""
+        return CubeSnapshot(self.angle_x, self.angle_y, self.angle_z,
+                            self.size, self.camera_distance, self.near_plane)
+    
+    def snapshot_at(self, elapsed):
+        """Snapshot of the orientation after spinning for elapsed seconds, without changing the cube"""
+        velocity_x, velocity_y, velocity_z = self.angular_velocity
+        return CubeSnapshot(
+            (velocity_x * elapsed) % (2 * math.pi),
+            (velocity_y * elapsed) % (2 * math.pi),
+            (velocity_z * elapsed) % (2 * math.pi),
+            self.size, self.camera_distance, self.near_plane
+        )
+    
+    def rotate_point(self, point, angle_x, angle_y, angle_z):
+        """Rotate a 3D point around x, y, and z axes"""
+        x, y, z = point
+        
+        # Rotate around X axis
+        cos_x, sin_x = math.cos(angle_x), math.sin(angle_x)
+        y, z = y * cos_x - z * sin_x, y * sin_x + z * cos_x
+        
+        # Rotate around Y axis
+        cos_y, sin_y = math.cos(angle_y), math.sin(angle_y)
+        x, z = x * cos_y + z * sin_y, -x * sin_y + z * cos_y
+        
+        # Rotate around Z axis
+        cos_z, sin_z = math.cos(angle_z), math.sin(angle_z)
+        x, y = x * cos_z - y * sin_z, x * sin_z + y * cos_z
+        
+        return [x, y, z]
+    
+    def project_3d_to_2d(self, point):
+        """Project 3D point to 2D screen coordinates"""
+        x, y, z = point
+        # Simple perspective projection
+        distance = self.camera_distance
+        # Never divide by a depth at or behind the near plane
+        factor = distance / max(distance + z, self.near_plane)
+        screen_x = int(x * factor * self.size)
+        screen_y = int(y * factor * self.size)
+        return screen_x, screen_y
+    
+    def transform_vertices(self):
+        """Rotate and project all vertices in one batch, returning (N, 4) homogeneous coordinates"""
+        return self.mesh.vertices @ frame_matrix(self.snapshot()).T
+    
+    def draw_line(self, canvas, x1, y1, x2, y2, char='*'):
+        """Draw a line on the framebuffer using Bresenham's algorithm"""
+        cells = canvas.cells
+        height, width = cells.shape
+        code = ord(char)
+        
+        dx = abs(x2 - x1)
+        dy = abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        
+        # Only walk the steps that land on the canvas, starting from the
+        # position and error the full line would have reached there
+        first, last = (int(step[0]) for step in visible_steps((x1, y1), (x2, y2), width, height))
+        
+        if dx > dy:
+            across = int(bresenham_offset(first, dx, dy))
+            x, y = x1 + sx * first, y1 + sy * across
+            err = dx / 2.0 - first * dy + across * dx
+            for _ in range(first, last + 1):
+                cells[y, x] = code
+                err -= dy
+                if err < 0:
+                    y += sy
+                    err += dx
+                x += sx
+        else:
+            across = int(bresenham_offset(first, dy, dx))
+            x, y = x1 + sx * across, y1 + sy * first
+            err = dy / 2.0 - first * dx + across * dy
+            for _ in range(first, last + 1):
+                cells[y, x] = code
+                err -= dx
+                if err < 0:
+                    x += sx
+                    err += dy
+                y += sy
+    
+    def render_frame(self, canvas_width, canvas_height, stats=None):
+        """Render one frame of the spinning cube with dynamic centering
+        
+        When a FrameStats is given, the transform and rasterize stages are timed.
+        """
+        return render_snapshot(self.snapshot(), canvas_width, canvas_height,
+                               self.mesh, self.framebuffer, stats)
+    
+    def stop(self):
+        """Stop the animation"""
+        self.running = False
+
+class LiveFrames:
+    """Frame source that renders a SpinningCube on demand
+    
+    Frame sources hand out (cells, snapshot) pairs for a point in animation
+    time. This one renders into a reused framebuffer, or through a
+    FrameCache when one is given.
+    """
+    
+    def __init__(self, cube, frame_cache=None):
+        self.cube = cube
+        self.frame_cache = frame_cache
+        self.framebuffer = FrameBuffer(0, 0)
+    
+    def fit(self, canvas_width, canvas_height):
+        """Resize the cube for a new canvas"""
+        self.cube.fit_to_canvas(canvas_width, canvas_height)
+    
+    def frame(self, elapsed, canvas_width, canvas_height, stats=None):
+        """Render the frame for elapsed seconds of animation"""
+        snapshot = self.cube.snapshot_at(elapsed)
+        if self.frame_cache is not None:
+            cells = self.frame_cache.render(snapshot, canvas_width, canvas_height, stats)
+        else:
+            cells = render_snapshot(snapshot, canvas_width, canvas_height,
+                                    self.cube.mesh, self.framebuffer, stats).cells
+        return cells, snapshot
+    
+    def summary(self):
+        """Status line for the source, empty when there is nothing to report"""
+        return self.frame_cache.summary() if self.frame_cache is not None else ""
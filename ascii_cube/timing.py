@@ -0,0 +1,208 @@
+"""Frame timing: per-stage statistics, deadline pacing and the animation clock"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+def _no_measure(stage):
+    """Stand-in for FrameStats.measure when timing is switched off"""
+    return nullcontext()
+
+class FrameStats:
+    """Rolling per-stage frame timings measured with time.perf_counter
+    
+    Stages are recorded from both the render thread and the Tk thread, so
+    all access goes through one lock.
+    """
+    
+    STAGES = ('transform', 'rasterize', 'stringify', 'frame', 'queue', 'present')
+    
+    def __init__(self, window=240, fps_window=1.0, trace=None):
+        self._lock = threading.Lock()
+        self.window = window
+        self.fps_window = fps_window
+        self.samples = {stage: deque(maxlen=window) for stage in self.STAGES}
+        self.presented = deque(maxlen=window)
+        self.trace = trace
+    
+    @contextmanager
+    def measure(self, stage):
+        """Time the body of a with block as one sample of a stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, start)
+    
+    def record(self, stage, seconds, start=None):
+        """Add one duration, in seconds, to a stage that started at start (default: seconds ago)"""
+        with self._lock:
+            if stage not in self.samples:
+                self.samples[stage] = deque(maxlen=self.window)
+            self.samples[stage].append(seconds)
+        if self.trace is not None:
+            if start is None:
+                start = time.perf_counter() - seconds
+            self.trace.add_span(stage, start, seconds)
+    
+    def mark_presented(self):
+        """Note that a frame reached the screen, for the measured FPS"""
+        with self._lock:
+            self.presented.append(time.perf_counter())
+    
+    def percentiles(self, stage, points=(50, 95, 99)):
+        """Return the nearest-rank percentiles of a stage in seconds, or None without samples"""
+        with self._lock:
+            values = sorted(self.samples.get(stage, ()))
+        if not values:
+            return None
+        last = len(values) - 1
+        return tuple(values[min(last, round(p / 100 * last))] for p in points)
+    
+    def fps(self):
+        """Frames presented per second over the last fps_window seconds"""
+        cutoff = time.perf_counter() - self.fps_window
+        with self._lock:
+            stamps = [stamp for stamp in self.presented if stamp >= cutoff]
+        if len(stamps) < 2:
+            return 0.0
+        return (len(stamps) - 1) / (stamps[-1] - stamps[0])
+    
+    def summary(self, point=95):
+        """One line with the given percentile of every stage, in milliseconds"""
+        index = (50, 95, 99).index(point)
+        parts = []
+        for stage in self.STAGES:
+            values = self.percentiles(stage)
+            if values is not None:
+                parts.append(f"{stage} {values[index] * 1000:.1f}")
+        return f"p{point} ms: " + ", ".join(parts) if parts else "Collecting timings..."
+
+class FrameScheduler:
+    """Paces a loop against absolute deadlines on the monotonic clock
+    
+    Each deadline is one period after the previous one, not after the end of
+    the last frame, so render time does not stretch the frame period. When
+    the loop falls more than a period behind, the deadlines it can no longer
+    make are skipped and counted as missed instead of being caught up.
+    While paused, wait blocks without a timeout until resume is called.
+    """
+    
+    def __init__(self, target_fps=24):
+        self._cond = threading.Condition()
+        self.target_fps = target_fps
+        self.deadline = None
+        self.missed = 0
+        self.paused = False
+    
+    def pause(self):
+        """Hold the loop in wait until resume"""
+        with self._cond:
+            self.paused = True
+    
+    def resume(self):
+        """Release a paused loop; the next frame is due at once"""
+        with self._cond:
+            if self.paused:
+                self.paused = False
+                self.deadline = None
+                self._cond.notify_all()
+    
+    def set_target_fps(self, target_fps):
+        """Change the frame rate; takes effect immediately, even mid-wait"""
+        with self._cond:
+            self.target_fps = max(1, target_fps)
+            # Restart the deadline grid from now at the new period
+            self.deadline = None
+            self._cond.notify_all()
+    
+    def reset(self):
+        """Start a fresh deadline grid from now, e.g. after the loop sat idle"""
+        with self._cond:
+            self.deadline = None
+            self._cond.notify_all()
+    
+    def wait(self):
+        """Block until the next frame is due, returning how many deadlines were skipped"""
+        with self._cond:
+            while True:
+                if self.paused:
+                    self._cond.wait()
+                    continue
+                now = time.monotonic()
+                if self.deadline is None:
+                    self.deadline = now
+                delay = self.deadline - now
+                if delay <= 0:
+                    break
+                self._cond.wait(delay)
+            
+            period = 1.0 / self.target_fps
+            skipped = int(-delay // period)
+            self.missed += skipped
+            self.deadline += (skipped + 1) * period
+            return skipped
+
+class AnimationClock:
+    """Seconds of animation on the monotonic clock, which stand still while paused"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.start = time.monotonic()
+        self.paused_at = None
+    
+    @property
+    def paused(self):
+        return self.paused_at is not None
+    
+    def elapsed(self):
+        """Animation time in seconds"""
+        with self._lock:
+            now = self.paused_at if self.paused_at is not None else time.monotonic()
+            return now - self.start
+    
+    def pause(self):
+        """Freeze the animation time"""
+        with self._lock:
+            if self.paused_at is None:
+                self.paused_at = time.monotonic()
+    
+    def resume(self):
+        """Let the animation time run on from where it was frozen"""
+        with self._lock:
+            if self.paused_at is not None:
+                self.start += time.monotonic() - self.paused_at
+                self.paused_at = None
+    
+    def toggle(self):
+        """Pause a running clock or resume a paused one"""
+        if self.paused:
+            self.resume()
+        else:
+            self.pause()
+
+class Invalidation:
+    """Dirty flag a render loop can block on until something visible changes
+    
+    Sources call invalidate with a reason ('spin', 'size', 'clock', ...);
+    wait returns every reason gathered since the previous wait.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self.reasons = set()
+    
+    def invalidate(self, reason):
+        """Mark the frame on screen as stale"""
+        with self._lock:
+            self.reasons.add(reason)
+            self._event.set()
+    
+    def wait(self):
+        """Block until the frame is stale, then clear the flag and return the reasons"""
+        self._event.wait()
+        with self._lock:
+            self._event.clear()
+            reasons, self.reasons = self.reasons, set()
+            return reasons
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""Benchmarks for the render pipeline
+
+Times the scalar helpers, the full render, frame-to-text conversion and a
+headless stand-in for the Tk presenter across a grid of canvas and cube
+sizes. Results can be saved as a JSON baseline and later runs compared
+against it:
+
+    python bench.py --save baseline.json
+    python bench.py --compare baseline.json --threshold 0.25
+
+Cold imports of the package and of its command line entry point are also
+timed with `python -X importtime`. Each must stay within --import-budget
+and must not load tkinter, curses or multiprocessing.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+import ascii_cube
+
+CANVAS_SIZES = [(80, 24), (160, 50), (240, 80), (400, 150), (500, 200)]
+CUBE_SIZES = [10, 20, 35]
+
+# Orientations cycled through by the frame benchmarks, so successive frames differ
+ORIENTATION_COUNT = 16
+
+# Import benchmarks: the package's own modules, dependencies excluded
+IMPORT_MODULES = ('ascii_cube', 'ascii_cube.cli')
+IMPORT_RUNS = 5
+
+# Modules that only the branches needing them may load
+DEFERRED_MODULES = ('tkinter', '_tkinter', 'curses', '_curses', 'multiprocessing')
+
+class HeadlessText:
+    """Stand-in for tk.Text that keeps its lines in a list
+
+    Supports just the indices TextDiffPresenter uses, so presenting can be
+    timed without a display.
+    """
+    
+    def __init__(self):
+        self.lines = ['']
+    
+    def config(self, **options):
+        pass
+    
+    def delete(self, first, last):
+        if (first, last) == ('1.0', 'end'):
+            self.lines = ['']
+            return
+        line = int(first.split('.')[0]) - 1
+        self.lines[line] = ''
+    
+    def insert(self, index, text):
+        if index == 'end':
+            self.lines[-1] += text
+            self.lines[-1:] = self.lines[-1].split('\n')
+            return
+        line = int(index.split('.')[0]) - 1
+        self.lines[line] = text + self.lines[line]
+
+def time_call(func, min_time=0.05, repeat=5):
+    """Best seconds per call of func over several calibrated runs"""
+    # Like timeit, keep the collector from landing in random samples
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _time_call(func, min_time, repeat)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+def _time_call(func, min_time, repeat):
+    """Double the loop count until a run takes min_time, then keep the best of repeat runs"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+def import_times(module):
+    """Import module in a fresh interpreter, returning {name: (self, cumulative)} seconds from -X importtime"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    times = {}
+    for match in re.finditer(r'^import time:\s+(\d+) \|\s+(\d+) \| +(\S+)$', result.stderr, re.MULTILINE):
+        times[match[3]] = (int(match[1]) / 1e6, int(match[2]) / 1e6)
+    return times
+
+def measure_import(module):
+    """Best of several cold imports: (own seconds, seconds with dependencies, deferred modules loaded)"""
+    package = module.split('.')[0]
+    best = None
+    for _ in range(IMPORT_RUNS):
+        times = import_times(module)
+        own = sum(self_time for name, (self_time, _) in times.items()
+                  if name == package or name.startswith(package + '.'))
+        if best is None or own < best[0]:
+            deferred = sorted(name for name in times if name.split('.')[0] in DEFERRED_MODULES)
+            best = (own, times[module][1], deferred)
+    return best
+
+def cycling(values):
+    """Return a function that hands out values round-robin"""
+    state = {'index': 0}
+    
+    def next_value():
+        value = values[state['index'] % len(values)]
+        state['index'] += 1
+        return value
+    return next_value
+
+def benchmark_cases(quick=False):
+    """Yield (name, callable) pairs for every benchmark"""
+    cube = ascii_cube.SpinningCube(size=20)
+    cube.angle_x, cube.angle_y, cube.angle_z = 0.4, 0.9, 0.2
+    
+    yield 'rotate_point', lambda: [cube.rotate_point(v, 0.4, 0.9, 0.2) for v in ascii_cube.CUBE_VERTICES]
+    rotated = [cube.rotate_point(v, 0.4, 0.9, 0.2) for v in ascii_cube.CUBE_VERTICES]
+    yield 'project_3d_to_2d', lambda: [cube.project_3d_to_2d(point) for point in rotated]
+    
+    canvas_sizes = CANVAS_SIZES[::2] if quick else CANVAS_SIZES
+    cube_sizes = CUBE_SIZES[1:2] if quick else CUBE_SIZES
+    
+    for width, height in canvas_sizes:
+        framebuffer = ascii_cube.FrameBuffer(width, height)
+        
+        # The twelve cube edges through the scalar Bresenham line
+        cube.fit_to_canvas(width, height)
+        clip = cube.transform_vertices()
+        points = ascii_cube.perspective_divide(clip, width // 2, height // 2).astype(int).tolist()
+        edges = [(points[a], points[b]) for a, b in ascii_cube.CUBE_EDGES]
+        
+        def draw_edges(framebuffer=framebuffer, edges=edges):
+            for (x1, y1), (x2, y2) in edges:
+                cube.draw_line(framebuffer, x1, y1, x2, y2, '█')
+        yield f'draw_line/{width}x{height}', draw_edges
+        
+        for size in cube_sizes:
+            cube.update_size(size)
+            snapshots = [cube.snapshot_at(i / 24) for i in range(ORIENTATION_COUNT)]
+            next_snapshot = cycling(snapshots)
+            
+            def render(framebuffer=framebuffer, next_snapshot=next_snapshot, width=width, height=height):
+                ascii_cube.render_snapshot(next_snapshot(), width, height, ascii_cube.CUBE_MESH, framebuffer)
+            yield f'render_frame/{width}x{height}/size{size}', render
+            
+            frames = [ascii_cube.render_snapshot(s, width, height).cells for s in snapshots]
+            next_cells = cycling(frames)
+            yield f'to_text/{width}x{height}/size{size}', lambda next_cells=next_cells: ascii_cube.cells_to_rows(next_cells())
+            
+            rows = [ascii_cube.cells_to_rows(cells) for cells in frames]
+            next_rows = cycling(rows)
+            presenter = ascii_cube.TextDiffPresenter(HeadlessText())
+            presenter.present(rows[-1])
+            yield (f'present/{width}x{height}/size{size}',
+                   lambda presenter=presenter, next_rows=next_rows: presenter.present(next_rows()))
+
+def run(name_filter=None, quick=False):
+    """Run the benchmarks and return {name: seconds per call}"""
+    results = {}
+    for name, func in benchmark_cases(quick):
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = time_call(func)
+        print(f"{name:40s} {results[name] * 1e6:12.1f} µs", flush=True)
+    return results
+
+def compare(results, baseline, threshold):
+    """Print the change against a baseline and return the names that regressed"""
+    regressions = []
+    print(f"\nCompared with baseline (threshold +{threshold:.0%}):")
+    for name, seconds in results.items():
+        if name not in baseline:
+            print(f"{name:40s} {'new':>12s}")
+            continue
+        change = seconds / baseline[name] - 1
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f"{name:40s} {change:+12.1%}{flag}")
+    return regressions
+
+def main(argv=None):
+    """Run the benchmarks, returning a non-zero exit status on regressions"""
+    parser = argparse.ArgumentParser(description="Benchmark the render pipeline")
+    parser.add_argument('--save', metavar='PATH', help="write results as a JSON baseline")
+    parser.add_argument('--compare', metavar='PATH', help="compare against a JSON baseline")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed slowdown before a benchmark counts as a regression (default: 0.25)")
+    parser.add_argument('--filter', metavar='TEXT', help="only run benchmarks whose name contains TEXT")
+    parser.add_argument('--quick', action='store_true', help="run a reduced grid")
+    parser.add_argument('--import-budget', type=float, default=25, metavar='MS',
+                        help="allowed import time of the package's own modules, "
+                             "for the package and for its CLI (default: 25)")
+    args = parser.parse_args(argv)
+    
+    results = {}
+    import_problems = []
+    for module in IMPORT_MODULES:
+        name = f'import/{module}'
+        if args.filter and args.filter not in name:
+            continue
+        own, total, deferred = measure_import(module)
+        results[name] = own
+        print(f"{name:40s} {own * 1e6:12.1f} µs  ({total * 1e3:.1f} ms with dependencies)", flush=True)
+        if own * 1000 > args.import_budget:
+            import_problems.append(f"importing {module} took {own * 1000:.1f} ms, over the {args.import_budget:g} ms budget")
+        if deferred:
+            import_problems.append(f"importing {module} loaded {', '.join(deferred)}")
+    results.update(run(args.filter, args.quick))
+    
+    if args.save:
+        document = {
+            'meta': {
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'machine': platform.machine(),
+                'platform': platform.platform(),
+            },
+            'results': results,
+        }
+        with open(args.save, 'w', encoding='utf-8') as stream:
+            json.dump(document, stream, indent=2, sort_keys=True)
+            stream.write('\n')
+        print(f"\nSaved {len(results)} results to {args.save}")
+    
+    status = 0
+    if import_problems:
+        print()
+        for problem in import_problems:
+            print(problem)
+        status = 1
+    
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as stream:
+            baseline = json.load(stream)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed past {args.threshold:.0%}")
+            status = 1
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
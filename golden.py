@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""Golden-frame checks for the render paths
+
+A corpus of reference frames is rendered once, at fixed orientations and
+canvas sizes, by a frozen copy of the original per-pixel renderer, and
+committed. Every render path (the scalar helpers, the pure pipeline, the
+SpinningCube wrapper, the frame cache, the process pool and the ANSI diff
+output) must reproduce it cell for cell:
+
+    python golden.py check
+    python golden.py generate --force   # only after an intended visual change
+"""
+import argparse
+import json
+import math
+import os
+import re
+import sys
+
+import numpy as np
+
+import ascii_cube
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden', 'frames.json')
+CORPUS_VERSION = 1
+
+# Angles are whole degrees, so they sit on the default FrameCache grid
+ORIENTATIONS = [
+    (0, 0, 0),
+    (30, 45, 0),
+    (90, 0, 45),
+    (17, 233, 101),
+    (180, 120, 300),
+    (359, 1, 271),
+]
+
+# (width, height, cube size, camera distance); the last cases push edges
+# far off the canvas and close to the camera. The reference renderer has no
+# near plane, so orientations that put a vertex behind it are left out.
+CANVASES = [
+    (80, 24, 10, 5),
+    (120, 40, 13, 5),
+    (160, 50, 16, 5),
+    (80, 24, 60, 5),
+    (120, 40, 20, 1.5),
+]
+
+# Mismatching rows shown per frame before the report is cut short
+MAX_DIFF_ROWS = 6
+
+# The original renderer, frozen so the corpus never follows the code it
+# checks. Only the camera distance, once fixed at 5, is taken from the snapshot.
+REFERENCE_VERTICES = [
+    [-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1],  # Back face
+    [-1, -1, 1], [1, -1, 1], [1, 1, 1], [-1, 1, 1]       # Front face
+]
+REFERENCE_EDGES = [
+    [0, 1], [1, 2], [2, 3], [3, 0],  # Back face
+    [4, 5], [5, 6], [6, 7], [7, 4],  # Front face
+    [0, 4], [1, 5], [2, 6], [3, 7]   # Connecting edges
+]
+
+def reference_rotate(point, angle_x, angle_y, angle_z):
+    """Rotate a 3D point around x, y, and z axes"""
+    x, y, z = point
+    
+    # Rotate around X axis
+    cos_x, sin_x = math.cos(angle_x), math.sin(angle_x)
+    y, z = y * cos_x - z * sin_x, y * sin_x + z * cos_x
+    
+    # Rotate around Y axis
+    cos_y, sin_y = math.cos(angle_y), math.sin(angle_y)
+    x, z = x * cos_y + z * sin_y, -x * sin_y + z * cos_y
+    
+    # Rotate around Z axis
+    cos_z, sin_z = math.cos(angle_z), math.sin(angle_z)
+    x, y = x * cos_z - y * sin_z, x * sin_z + y * cos_z
+    
+    return [x, y, z]
+
+def reference_project(point, size, distance):
+    """Project 3D point to 2D screen coordinates"""
+    x, y, z = point
+    factor = distance / (distance + z)
+    return int(x * factor * size), int(y * factor * size)
+
+def reference_draw_line(canvas, x1, y1, x2, y2, char):
+    """Draw a line on the canvas using Bresenham's algorithm, one bounds-checked cell at a time"""
+    dx = abs(x2 - x1)
+    dy = abs(y2 - y1)
+    x, y = x1, y1
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    
+    if dx > dy:
+        err = dx / 2.0
+        while x != x2:
+            if 0 <= y < len(canvas) and 0 <= x < len(canvas[0]):
+                canvas[y][x] = char
+            err -= dy
+            if err < 0:
+                y += sy
+                err += dx
+            x += sx
+    else:
+        err = dy / 2.0
+        while y != y2:
+            if 0 <= y < len(canvas) and 0 <= x < len(canvas[0]):
+                canvas[y][x] = char
+            err -= dx
+            if err < 0:
+                x += sx
+                err += dy
+            y += sy
+    
+    # Draw end point
+    if 0 <= y2 < len(canvas) and 0 <= x2 < len(canvas[0]):
+        canvas[y2][x2] = char
+
+def render_reference(snapshot, width, height):
+    """Render a snapshot with the frozen renderer, or None when a vertex is behind the near plane"""
+    canvas = [[' ' for _ in range(width)] for _ in range(height)]
+    center_x = width // 2
+    center_y = height // 2
+    
+    rotated = [reference_rotate(vertex, *snapshot[:3]) for vertex in REFERENCE_VERTICES]
+    if any(snapshot.camera_distance + z < snapshot.near_plane for _, _, z in rotated):
+        return None
+    projected = []
+    for point in rotated:
+        x, y = reference_project(point, snapshot.size, snapshot.camera_distance)
+        projected.append((x + center_x, y + center_y))
+    
+    for start, end in REFERENCE_EDGES:
+        # Choose character based on edge orientation for visual effect
+        if start < 4 and end < 4:  # Back face
+            char = '·'
+        elif start >= 4 and end >= 4:  # Front face
+            char = '█'
+        else:  # Connecting edges
+            char = '▓'
+        reference_draw_line(canvas, *projected[start], *projected[end], char)
+    
+    # Draw vertices as points
+    for i, (x, y) in enumerate(projected):
+        if 0 <= y < height and 0 <= x < width:
+            canvas[y][x] = '●' if i >= 4 else '○'
+    
+    return [''.join(row) for row in canvas]
+
+def corpus_snapshots():
+    """Yield (name, snapshot, width, height) for every corpus case"""
+    for width, height, size, distance in CANVASES:
+        for angles in ORIENTATIONS:
+            radians = [math.radians(angle) for angle in angles]
+            snapshot = ascii_cube.CubeSnapshot(*radians, size, distance, 0.1)
+            name = f"{width}x{height}-size{size}-d{distance}-" + "-".join(str(a) for a in angles)
+            yield name, snapshot, width, height
+
+def generate(path):
+    """Render the corpus with the frozen reference renderer and write it to path"""
+    frames = []
+    for name, snapshot, width, height in corpus_snapshots():
+        rows = render_reference(snapshot, width, height)
+        if rows is None:
+            continue
+        frames.append({
+            'name': name,
+            'width': width,
+            'height': height,
+            'snapshot': snapshot._asdict(),
+            'rows': rows,
+        })
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as stream:
+        json.dump({'version': CORPUS_VERSION, 'frames': frames}, stream, ensure_ascii=False, indent=1)
+        stream.write('\n')
+    return len(frames)
+
+def load(path):
+    """Load the corpus, returning (name, snapshot, width, height, rows) tuples"""
+    with open(path, encoding='utf-8') as stream:
+        corpus = json.load(stream)
+    if corpus.get('version') != CORPUS_VERSION:
+        raise ValueError(f"{path} is not a version {CORPUS_VERSION} corpus")
+    return [
+        (frame['name'], ascii_cube.CubeSnapshot(**frame['snapshot']), frame['width'], frame['height'], frame['rows'])
+        for frame in corpus['frames']
+    ]
+
+def replay_ansi(screen, data):
+    """Apply the cursor-positioned writes AnsiTerminal emits to a list of row lists"""
+    for match in re.finditer(r'\x1b\[(\d+);(\d+)H([^\x1b]*)', data):
+        y, x, text = int(match[1]) - 1, int(match[2]) - 1, match[3]
+        screen[y][x:x + len(text)] = list(text)
+    return screen
+
+def render_scalar(cases):
+    """The scalar helpers: rotate_point, project_3d_to_2d and draw_line"""
+    cube = ascii_cube.SpinningCube()
+    mesh = ascii_cube.CUBE_MESH
+    for name, snapshot, width, height, _ in cases:
+        cube.size, cube.camera_distance, cube.near_plane = snapshot.size, snapshot.camera_distance, snapshot.near_plane
+        rotated = [cube.rotate_point(vertex, *snapshot[:3]) for vertex in ascii_cube.CUBE_VERTICES]
+        points = [(x + width // 2, y + height // 2) for x, y in map(cube.project_3d_to_2d, rotated)]
+        framebuffer = ascii_cube.FrameBuffer(width, height)
+        for (start, end), code in zip(ascii_cube.CUBE_EDGES, mesh.edge_codes.tolist()):
+            cube.draw_line(framebuffer, *points[start], *points[end], chr(code))
+        for (x, y), code in zip(points, mesh.vertex_codes.tolist()):
+            if 0 <= x < width and 0 <= y < height:
+                framebuffer.cells[y, x] = code
+        yield framebuffer.to_rows()
+
+def render_pipeline(cases):
+    """The pure render_snapshot function"""
+    for name, snapshot, width, height, _ in cases:
+        yield ascii_cube.render_snapshot(snapshot, width, height).to_rows()
+
+def render_spinning_cube(cases):
+    """SpinningCube.render_frame with its fields set from each snapshot"""
+    cube = ascii_cube.SpinningCube()
+    for name, snapshot, width, height, _ in cases:
+        cube.angle_x, cube.angle_y, cube.angle_z = snapshot.angle_x, snapshot.angle_y, snapshot.angle_z
+        cube.size, cube.camera_distance, cube.near_plane = snapshot.size, snapshot.camera_distance, snapshot.near_plane
+        yield cube.render_frame(width, height).to_rows()
+
+def render_frame_cache(cases):
+    """FrameCache lookups, on both misses and hits"""
+    cache = ascii_cube.FrameCache(64 * 2**20)
+    # Every case twice: the first pass fills the cache, the second hits it
+    for _ in range(2):
+        for name, snapshot, width, height, _ in cases:
+            yield ascii_cube.cells_to_rows(cache.render(snapshot, width, height))
+
+def render_process_pool(cases):
+    """render_in_pool worker processes, one batch per canvas size"""
+    for width, height in dict.fromkeys((case[2], case[3]) for case in cases):
+        batch = [case[1] for case in cases if (case[2], case[3]) == (width, height)]
+        for cells in ascii_cube.render_in_pool(batch, width, height, jobs=2):
+            yield ascii_cube.cells_to_rows(cells)
+
+def render_ansi(cases):
+    """AnsiTerminal diff output, replayed onto a screen"""
+    terminal = ascii_cube.AnsiTerminal(stream=None)
+    screen = None
+    for name, snapshot, width, height, _ in cases:
+        cells = ascii_cube.render_snapshot(snapshot, width, height).cells
+        if screen is None or terminal.previous is None or terminal.previous.shape != cells.shape:
+            screen = [[' '] * width for _ in range(height)]
+        replay_ansi(screen, terminal.encode(cells))
+        terminal.previous = cells
+        yield [''.join(row) for row in screen]
+
+RENDERERS = {
+    'scalar': render_scalar,
+    'pipeline': render_pipeline,
+    'spinning-cube': render_spinning_cube,
+    'frame-cache': render_frame_cache,
+    'process-pool': render_process_pool,
+    'ansi': render_ansi,
+}
+
+def expected_order(renderer, cases):
+    """The corpus cases in the order a renderer produces its frames"""
+    if renderer == 'frame-cache':
+        return cases * 2
+    if renderer == 'process-pool':
+        sizes = dict.fromkeys((case[2], case[3]) for case in cases)
+        return [case for size in sizes for case in cases if (case[2], case[3]) == size]
+    return cases
+
+def diff_frame(expected, actual):
+    """Return a readable report of the cells that differ, or None when the frames match"""
+    if len(expected) != len(actual) or any(len(a) != len(b) for a, b in zip(expected, actual)):
+        return f"  size differs: expected {len(expected[0])}x{len(expected)}, got {len(actual[0]) if actual else 0}x{len(actual)}"
+    
+    expected_cells = np.array([list(row) for row in expected])
+    actual_cells = np.array([list(row) for row in actual])
+    mismatched = expected_cells != actual_cells
+    if not mismatched.any():
+        return None
+    
+    lines = [f"  {int(mismatched.sum())} cell(s) differ in {int(mismatched.any(axis=1).sum())} row(s)"]
+    for y in np.flatnonzero(mismatched.any(axis=1))[:MAX_DIFF_ROWS]:
+        columns = np.flatnonzero(mismatched[y])
+        lines.append(f"  row {y}, columns {columns.tolist()}")
+        lines.append(f"    expected |{expected[y]}|")
+        lines.append(f"    actual   |{actual[y]}|")
+        lines.append("              " + ''.join('^' if flag else ' ' for flag in mismatched[y]))
+    hidden = int(mismatched.any(axis=1).sum()) - MAX_DIFF_ROWS
+    if hidden > 0:
+        lines.append(f"  ... {hidden} more row(s)")
+    return '\n'.join(lines)
+
+def check(path, renderers):
+    """Compare each renderer against the corpus, printing diffs; returns the failure count"""
+    cases = load(path)
+    failures = 0
+    for renderer in renderers:
+        ordered = expected_order(renderer, cases)
+        mismatches = 0
+        for (name, _, _, _, rows), actual in zip(ordered, RENDERERS[renderer](cases)):
+            report = diff_frame(rows, actual)
+            if report is not None:
+                mismatches += 1
+                print(f"[{renderer}] {name}\n{report}")
+        status = "ok" if mismatches == 0 else f"{mismatches} of {len(ordered)} frames differ"
+        print(f"{renderer:15s} {status}")
+        failures += mismatches
+    return failures
+
+def main(argv=None):
+    """Generate or check the golden corpus"""
+    parser = argparse.ArgumentParser(description="Golden-frame checks for the render paths")
+    parser.add_argument('--corpus', default=CORPUS_PATH, help="corpus file (default: golden/frames.json)")
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    generate_parser = commands.add_parser('generate', help="render the reference frames")
+    generate_parser.add_argument('--force', action='store_true', help="overwrite an existing corpus")
+    
+    check_parser = commands.add_parser('check', help="compare render paths with the reference frames")
+    check_parser.add_argument('--renderer', action='append', choices=sorted(RENDERERS),
+                              help="renderer to check; may be repeated (default: all)")
+    args = parser.parse_args(argv)
+    
+    if args.command == 'generate':
+        if os.path.exists(args.corpus) and not args.force:
+            print(f"{args.corpus} exists; pass --force to replace the reference frames")
+            return 1
+        count = generate(args.corpus)
+        print(f"Wrote {count} reference frames to {args.corpus}")
+        return 0
+    
+    failures = check(args.corpus, args.renderer or list(RENDERERS))
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())